@@ -175,9 +175,18 @@ class FullTiltHandParser:
                 if m:
                     hand_info['actions'][current_street].append({
                         'player': m.group(1),
-                        'action': m.group(2),
+                        # Lower-case by construction (action_re literals), so the replayer compares it as-is;
+                        # interned so verb comparisons in the replayer hit the identity fast path
+                        'action': sys.intern(m.group(2)),
                         'detail': m.group(3).strip()
                     })
+        # Lower-cased detail, so case-insensitive keyword checks don't re-lower on every replay
+        for street_actions in hand_info['actions'].values():
+            for act in street_actions:
+                act['_detail_lower'] = act['detail'].lower()
+        # Seat-ordered player names, reused by the replayer to seed per-player maps
+        hand_info['_player_names'] = tuple(p['name'] for p in hand_info['players'])
+        hand_info['_player_idx'] = {name: i for i, name in enumerate(hand_info['_player_names'])}
         return hand_info
 
     def check_voluntary_investment(self, hand_history):
@@ -1,5 +1,8 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox
+import bisect
+from collections import OrderedDict, defaultdict
+import itertools
 import math
 import re
 from ft_hand_parser import FullTiltHandParser
@@ -9,16 +12,23 @@ import sqlite3
 
 # Optional high-quality PNG loading/resizing via Pillow
 try:
-    from PIL import Image, ImageTk
+    from PIL import Image, ImageDraw, ImageTk
     PIL_AVAILABLE = True
 except Exception:
     Image = None
+    ImageDraw = None
     ImageTk = None
     PIL_AVAILABLE = False
 
 SEATS = 9
 CARD_WIDTH = 120
 CARD_HEIGHT = 160
+# Max sized card PhotoImages kept (52 faces + backs at a couple of sizes fit easily)
+CARD_IMAGE_CACHE_SIZE = 256
+# Max overlapped hole-card pair composites kept (every seat's pair across a few hands)
+HOLE_PAIR_CACHE_SIZE = 64
+# Max community-card composites kept (one hand needs at most three boards)
+BOARD_COMPOSITE_CACHE_SIZE = 8
 SEAT_RADIUS = 44
 CARD_OFFSET_PX = 70  # Increased to move cards further inward
 # Fixed-size seat rectangles
@@ -30,35 +40,268 @@ SEAT_BOX_HEIGHT = 108
 SEAT_BORDER_RADIUS = 16
 SEAT_BORDER_COLOR = "#808080"
 SEAT_BORDER_WIDTH = 6
+# Chip marker layers: (anchor list attribute, radius, fill, outline, text color)
+MARKER_STYLES = {
+    'bets': ('_bet_anchors', 25, "#70f040", "#222", "#000"),    # blinds/bets/calls/raises (green)
+    'antes': ('_ante_anchors', 22, "#a0522d", "#3a2415", "#fff"),  # antes (brown, slightly more center)
+    'wins': ('_win_anchors', 26, "#ffd700", "#7a5a00", "#000"),   # winnings (gold, closest to the seat)
+}
 DEALER_BTN_RADIUS = 30
 DEALER_BTN_MARGIN = 6
 # Action flash overlay duration (milliseconds)
 ACTION_FLASH_MS = 1000
+# Typing pause (milliseconds) after which edited notes are saved in the background
+NOTES_SAVE_DEBOUNCE_MS = 300
 INFO_PLACEHOLDER = "—"
+# Betting streets in playback order
+STREETS = ('preflop', 'flop', 'turn', 'river')
+STREET_INDEX = {s: i for i, s in enumerate(STREETS)}
+# Sort rank of street key spellings (lower-cased) used by the SPR helpers; unknown keys sort last
+_STREET_PRIORITY = {name: i for i, name in enumerate(
+    ('preflop', 'pre-flop', 'pre flop', 'flop', 'turn', 'river', 'showdown'))}
+# Per-player maps of the running stream state, saved per action so a step back can be undone
+_STREAM_PLAYER_MAPS = ('pot_contrib', 'contrib', 'ante_contrib', 'stacks', 'winnings')
+_MISSING = object()
+# Unit ellipse direction per seat, clockwise from the top (seat 1); scaled by the table radii
+_SEAT_UNIT_VECS = tuple(
+    (math.cos(2 * math.pi * i / SEATS - math.pi / 2), math.sin(2 * math.pi * i / SEATS - math.pi / 2))
+    for i in range(SEATS)
+)
+# Precompiled patterns for action detail parsing (hot path while stepping through a hand)
+_FIRST_AMOUNT_RE = re.compile(r'(\d[\d,]*)')
+_RAISE_TO_RE = re.compile(r'raises\s+to\s+(\d[\d,]*)')
+_RETURNED_TO_RE = re.compile(r"returned\s+to\s+(.+)$", re.IGNORECASE)
+_TRAILING_PUNCT_RE = re.compile(r"[.\s]+$")
+# Bracketed card lists ("shows [9s Jd]") and the rank/suit parts of a card token
+_BRACKET_RE = re.compile(r"\[([^\]]+)\]")
+_CARD_RANKS = frozenset(('2', '3', '4', '5', '6', '7', '8', '9', '10',
+                         't', 'T', 'j', 'J', 'q', 'Q', 'k', 'K', 'a', 'A'))
+_CARD_SUITS = frozenset('shdcSHDC')
+# Summary seat line with mucked hole cards ("Seat 4: name (big blind) mucked [3s 6d] ...")
+_MUCKED_RE = re.compile(r"^\s*([^:]+?)\s*(?:\([^)]*\))?\s*mucked\s*\[([^\]]+)\]", re.IGNORECASE)
+# Action verbs / phrases used when classifying the hero's result for a hand
+_WIN_ACTIONS = frozenset(('wins', 'collected'))
+_VPIP_ACTIONS = frozenset(('bets', 'calls', 'raises'))
+_SHOWDOWN_ACTIONS = frozenset(('shows', 'mucks', 'wins', 'collected'))
+_TIE_RE = re.compile(r'ties for (?:the )?(?:side )?pot')
+# Seat overlay text flashed for each action verb; 'posts' and 'antes' are left out
+# so forced bets don't flash
+_ACTION_OVERLAY = {
+    'bets': 'BET',
+    'calls': 'CALL',
+    'raises': 'RAISE',
+    'checks': 'CHECK',
+    'folds': 'FOLD',
+    'shows': 'SHOWS',
+    'mucks': 'MUCKS',
+    'is sitting out': 'SIT OUT',
+    'has returned': 'RETURNED',
+    'wins': 'WINS',
+    'collected': 'WINS',
+}
+# Hand number ("Game #123...") in a hand header line
+_GAME_NO_RE = re.compile(r"Game\s*#\s*([0-9]+)", re.IGNORECASE)
+# Session panel fields in a hand header. The room prefix (before "Game #") is matched on its
+# own, since it may itself contain a table or date. Hand number, table number and
+# YYYY/MM/DD (or -) dates come from one left-to-right pass over the whole header; hand and
+# table are zero-width lookaheads so they never consume text another field starts in.
+_ROOM_RE = re.compile(r"^\s*(.+?)\s+Game\s*#", re.IGNORECASE)
+_SESSION_HEADER_RE = re.compile(
+    r"(?=Game\s*#\s*(?P<hand>[0-9]+))"
+    r"|(?=\bTable\s+(?P<table>[A-Za-z0-9\-]+))"
+    r"|\b(?P<date>\d{4}[/-]\d{2}[/-]\d{2})\b",
+    re.IGNORECASE)
+# _extract_session_info result for a missing/empty header
+_EMPTY_SESSION_INFO = {"room": "", "game": "", "date": "", "hand_no": "", "table_no": "", "bounty": ""}
+# Keywords marking the ' - ' header segment that names the poker game
+_GAME_NAME_RE = re.compile(r"hold|omaha|stud|razz|limit|draw|hilo|hi/lo|eight-or-better", re.IGNORECASE)
+# KO bounty in a tournament header ("$3 + $0.30 KO Sit & Go")
+_BOUNTY_RE = re.compile(r"\$\s*\d+(?:\.\d{1,2})?\s*\+\s*\$(\d+(?:\.\d{1,2})?)\s*(?:KO|Knockout)\b", re.IGNORECASE)
+
+# Notes DB statements (kept as constants so sqlite3's statement cache reuses the prepared plans)
+_SQL_NOTES_BY_HAND = "SELECT note, mistakes FROM notes WHERE hand_id = ?"
+_SQL_DELETE_NOTE = "DELETE FROM notes WHERE hand_id = ?"
+_SQL_UPSERT_NOTE = """
+    INSERT INTO notes (hand_id, note, mistakes, updated_at)
+    VALUES (?, ?, ?, datetime('now'))
+    ON CONFLICT(hand_id) DO UPDATE SET
+        note = excluded.note,
+        mistakes = excluded.mistakes,
+        updated_at = excluded.updated_at
+"""
 
 def get_hero_result(hand, hero=None):
     vpip = False
     # Scan all actions for hero wins or ties
-    for street in ['preflop', 'flop', 'turn', 'river']:
+    for street in STREETS:
         for act in hand['actions'][street]:
             if act.get('player') != hero:
                 continue
-            action = (act.get('action') or '').lower()
-            detail = (act.get('detail') or '').lower()
+            # Parser verbs are already lower-case
+            action = act.get('action') or ''
             # Win (handle both 'wins' and 'collected')
-            if action in ('wins', 'collected'):
+            if action in _WIN_ACTIONS:
                 return 1
             # Split pot detection (various phrasings)
-            if action.startswith('ties for') or 'ties for the pot' in detail or 'ties for the side pot' in detail:
+            if _TIE_RE.match(action) or _TIE_RE.search(act.get('_detail_lower', '')):
                 return 1
             # Check VPIP
-            if action in ('bets', 'calls', 'raises'):
+            if action in _VPIP_ACTIONS:
                 vpip = True
                 # Don't return yet; hero might still win later on another street
                 # Break inner loop to move to the next street
                 #break
     return -1 if vpip else 0
 
+# ====== Chip-moving action handlers (dispatched by verb from process_action) ======
+# contrib is prefilled with the seated players. Names outside it (e.g. chat lines the parser
+# read as actions, "railbird: he calls 5000 ...") move no chips.
+
+def _do_contrib(app, act, contrib):
+    # Blinds, bets and calls: count in both pot and street contribution
+    player = act['player']
+    if player not in contrib:
+        return
+    amt = app._parsed(act)['amt']
+    app.pot += amt
+    contrib[player] += amt
+
+
+def _do_ante(app, act, contrib):
+    # Antes: pot only, excluded from street contribution
+    if act['player'] not in contrib:
+        return
+    app.pot += app._parsed(act)['amt']
+
+
+def _do_raise(app, act, contrib):
+    player = act['player']
+    if player not in contrib:
+        return
+    prev = contrib[player]
+    delta = max(0, app._parsed(act)['raise_to'] - prev)
+    app.pot += delta
+    contrib[player] = prev + delta
+
+
+# Verbs missing from the map (checks, folds, shows, ...) don't move chips
+_ACTION_HANDLERS = {
+    'posts': _do_contrib,
+    'antes': _do_ante,
+    'bets': _do_contrib,
+    'calls': _do_contrib,
+    'raises': _do_raise,
+}
+
+
+# Stack replay (compute_stacks_upto): chips leave the stack for money put in the pot and
+# come back for winnings and uncalled bets. street_non_ante tracks 'raises to' deltas.
+# Both maps are prefilled with the seated players; other names (chat lines the parser read as
+# actions) are skipped, which also covers the 'Board' pseudo-player and missing names.
+
+def _stack_pay(app, act, stacks, street_non_ante):
+    # Blinds, bets and calls
+    player = act.get('player')
+    if player not in street_non_ante:
+        return
+    amt = app._parsed(act)['amt']
+    if amt > 0:
+        stacks[player] -= amt
+    street_non_ante[player] += amt
+
+
+def _stack_ante(app, act, stacks, street_non_ante):
+    # Antes reduce the stack but are not part of the street contribution
+    player = act.get('player')
+    if player not in street_non_ante:
+        return
+    amt = app._parsed(act)['amt']
+    if amt > 0:
+        stacks[player] -= amt
+
+
+def _stack_raise(app, act, stacks, street_non_ante):
+    player = act.get('player')
+    if player not in street_non_ante:
+        return
+    prev = street_non_ante[player]
+    delta = max(0, app._parsed(act)['raise_to'] - prev)
+    if delta > 0:
+        stacks[player] -= delta
+    street_non_ante[player] = prev + delta
+
+
+def _stack_win(app, act, stacks, street_non_ante):
+    player = act.get('player')
+    if player not in street_non_ante:
+        return
+    amt = app._parsed(act)['amt']
+    if amt > 0:
+        stacks[player] += amt
+
+
+def _stack_uncalled(app, act, stacks, street_non_ante):
+    # Return the uncalled portion to the bettor and reduce their displayed contribution
+    parsed = app._parsed(act)
+    amt = parsed['amt']
+    recipient = act.get('player') or parsed['returned_to']
+    if recipient not in street_non_ante:
+        return
+    if amt > 0:
+        stacks[recipient] += amt
+    street_non_ante[recipient] = max(0, street_non_ante[recipient] - amt)
+
+
+_STACK_HANDLERS = {
+    'posts': _stack_pay,
+    'antes': _stack_ante,
+    'bets': _stack_pay,
+    'calls': _stack_pay,
+    'raises': _stack_raise,
+    'wins': _stack_win,
+    'collected': _stack_win,
+    'uncalled': _stack_uncalled,
+}
+
+# Street contribution snapshots (_build_contrib_prefix): per-seat-order amount lists.
+# Names without a seat index (chat lines the parser read as actions) are skipped.
+
+def _contrib_pay(app, act, player_idx, non_ante, antes):
+    # Blinds, bets and calls
+    i = player_idx.get(act['player'])
+    if i is not None:
+        non_ante[i] += app._parsed(act)['amt']
+
+
+def _contrib_ante(app, act, player_idx, non_ante, antes):
+    i = player_idx.get(act['player'])
+    if i is not None:
+        antes[i] += app._parsed(act)['amt']
+
+
+def _contrib_raise(app, act, player_idx, non_ante, antes):
+    i = player_idx.get(act['player'])
+    if i is not None:
+        non_ante[i] = max(non_ante[i], app._parsed(act)['raise_to'])
+
+
+def _contrib_uncalled(app, act, player_idx, non_ante, antes):
+    # Reduce the bettor's displayed street contribution by the uncalled amount
+    parsed = app._parsed(act)
+    i = player_idx.get(act['player'] or parsed['returned_to'])
+    if i is not None:
+        non_ante[i] = max(0, non_ante[i] - parsed['amt'])
+
+
+_CONTRIB_HANDLERS = {
+    'posts': _contrib_pay,
+    'antes': _contrib_ante,
+    'bets': _contrib_pay,
+    'calls': _contrib_pay,
+    'raises': _contrib_raise,
+    'uncalled': _contrib_uncalled,
+}
+
 class HandReplayerGUI:
     def __init__(self, root):
         self.root = root
@@ -67,6 +310,10 @@ class HandReplayerGUI:
         self.parser = None
         self.hands = []
         self.heroes = [] # Shouldn't this just be a single field?
+        # Flat per-hand lists built once when a file is opened (parallel to self.hands/self.heroes):
+        # hero result (see get_hero_result) and Game # used as the notes key
+        self._hand_result = []
+        self._hand_ids = []
         self.current_hand_index = 0
         self.current_street = None
         self.current_action_index = None
@@ -74,6 +321,30 @@ class HandReplayerGUI:
         self.player_cards = {}
         self.sitting_out_players = set()
         self._last_action_index = None
+        # (hand, street, action index) last shown by update_action_viewer
+        self._view_key = None
+        # PhotoImage references for table canvas image items: item_id -> photo
+        self._canvas_images = {}
+        # Inputs each table canvas layer was last drawn from (see update_table_canvas)
+        self._table_layer_keys = {}
+        # Seat centers and bet/ante/winnings marker anchors for the current canvas size
+        self._seat_positions = []
+        self._bet_anchors = []
+        self._ante_anchors = []
+        self._win_anchors = []
+        # True while an idle-time table redraw is scheduled (see request_table_redraw)
+        self._redraw_pending = False
+        # Info panel StringVar writes staged during update_info_panel: str(var) -> (var, value)
+        self._staged_vars = None
+        # Trailing-timer id that coalesces <Configure> bursts (see on_canvas_resize)
+        self._resize_after = None
+        # Player name -> seat for the hand currently drawn (see _get_seat_map)
+        self._name_to_seat = {}
+        # Action log currently in the playback Text widget and its '->' line (see display_action_history)
+        self._log_lines_shown = None
+        self._log_arrow_line = None
+        # Running pot/contrib/board state for the current position (advanced incrementally)
+        self._reset_stream_state()
 
         # Notes / DB state
         self._db = None
@@ -81,6 +352,8 @@ class HandReplayerGUI:
         # When True, navigation shortcuts (arrow keys / ctrl-arrow) should be suppressed
         self.notes_dirty = False
         self._loading_notes = False
+        # Pending after() id for the debounced notes save (see on_notes_changed)
+        self._notes_save_after = None
         self.notes_text = None
         self.mistakes_text = None
          # When True, navigation shortcuts (arrow keys / ctrl-arrow) should be suppressed
@@ -88,11 +361,20 @@ class HandReplayerGUI:
         self._notes_focused = False
         # Hand selector markers for notes
         self.hand_note_markers = {}
+        # Hand ids of the loaded file that have a saved note; filled by refresh_all_note_markers
+        # and kept current by note saves/clears. None means unknown (ask the DB).
+        self._note_ids = None
+        # hand_id -> (note, mistakes), stripped, as last read from or written to the DB;
+        # lets saves of unchanged text skip SQLite
+        self._notes_cache = {}
         # Geometry cache for selector to place/update markers
         self._selector_box_w = 26
         self._selector_box_h = 52
         self._selector_gap = 4
         self._selector_y_base = 20
+        # Fill color currently shown per selector box and the index drawn as selected
+        self._selector_colors = []
+        self._selector_highlight = None
         
         # Info panel state
         self.info_blinds_var = tk.StringVar(value=INFO_PLACEHOLDER)
@@ -104,6 +386,8 @@ class HandReplayerGUI:
         self.info_street_var = tk.StringVar(value=INFO_PLACEHOLDER)
         self.info_truebb_var = tk.StringVar(value=INFO_PLACEHOLDER)
         self.info_pot_odds_player_var = tk.StringVar(value=INFO_PLACEHOLDER)
+        self.info_spr_var = tk.StringVar(value=INFO_PLACEHOLDER)
+        self.info_pts_var = tk.StringVar(value=INFO_PLACEHOLDER)
         # Session/tournament-wide info panel state
         self.session_room_var = tk.StringVar(value=INFO_PLACEHOLDER)
         self.session_game_var = tk.StringVar(value=INFO_PLACEHOLDER)
@@ -128,9 +412,19 @@ class HandReplayerGUI:
 
         # Card image caches
         self.card_image_paths = {}
-        self.card_image_cache = {}
+        # (key, w, h) -> PhotoImage, least recently used first
+        self.card_image_cache = OrderedDict()
         self.card_back_key = None
-        self.load_card_images()
+        # Decoded RGBA source image per card key (Pillow only), filled by load_card_images
+        self._card_source_images = {}
+        # Composited community-card images keyed by (cards, w, h, gap), least recently used first
+        self._board_composite_cache = OrderedDict()
+        # Pre-rendered rounded seat boxes (Pillow only) keyed by fill color
+        self._seat_sprites = {}
+        # Composited seat hole-card pairs keyed by (back, front, w, h, dx, dy), least recently used first
+        self._hole_pair_cache = OrderedDict()
+        # Decode card art once the window is up; no hand (and so no card) is shown before that
+        self.root.after_idle(self.load_card_images)
 
         # Bind arrow keys for navigation
         self.bind_keys()
@@ -143,39 +437,61 @@ class HandReplayerGUI:
             self.root.bind_all("<Command-s>", lambda e: self.save_current_hand_notes())  # macOS
         except Exception:
             pass
-        # Helper to check whether notes/mistakes Text widgets currently have focus.
-        def _notes_have_focus():
-            try:
-                focused = self.root.focus_get()
-                return focused is self.notes_text or focused is self.mistakes_text or getattr(self, "_notes_focused", False)
-            except Exception:
-                return getattr(self, "_notes_focused", False)
-
         # Hands - only navigate when notes aren't focused (so text editing arrow keys work)
-        self.root.bind("<Left>", lambda e: None if _notes_have_focus() else self.navigate_hands(-1))  # previous hand
-        self.root.bind("<Right>", lambda e: None if _notes_have_focus() else self.navigate_hands(1))  # next hand
+        self.root.bind("<Left>", self._on_key_prev_hand)           # previous hand
+        self.root.bind("<Right>", self._on_key_next_hand)          # next hand
         # Actions
-        self.root.bind("<Up>", lambda e: None if _notes_have_focus() else self.prev_action())         # previous action
-        self.root.bind("<Down>", lambda e: None if _notes_have_focus() else self.next_action())       # next action
-        # New shortcuts (unchanged):
-        # - Ctrl+Left: jump to beginning of current hand
-        self.root.bind("<Control-Up>", lambda e: None if _notes_have_focus() else self.jump_to_hand_start())
-        # - Ctrl+Right: jump to end of current hand
-        self.root.bind("<Control-Down>", lambda e: None if _notes_have_focus() else self.jump_to_hand_end())
-        
-        # - Ctrl+Up: jump to last hand; Ctrl+Down: jump to first hand
-        self.root.bind("<Control-Right>", lambda e: None if _notes_have_focus() else (self.select_hand(len(self.hands) - 1) if self.hands else None))
-        self.root.bind("<Control-Left>", lambda e: None if _notes_have_focus() else (self.select_hand(0) if self.hands else None))
-        # New shortcuts (unchanged):
-        # - Ctrl+Left: jump to beginning of current hand
-        self.root.bind("<Control-Up>", lambda e: None if _notes_have_focus() else self.jump_to_hand_start())
-        # - Ctrl+Right: jump to end of current hand
-        self.root.bind("<Control-Down>", lambda e: None if _notes_have_focus() else self.jump_to_hand_end())
-        
-        # - Ctrl+Up: jump to last hand; Ctrl+Down: jump to first hand
-        self.root.bind("<Control-Right>", lambda e: None if _notes_have_focus() else (self.select_hand(len(self.hands) - 1) if self.hands else None))
-        self.root.bind("<Control-Left>", lambda e: None if _notes_have_focus() else (self.select_hand(0) if self.hands else None))
-        
+        self.root.bind("<Up>", self._on_key_prev_action)           # previous action
+        self.root.bind("<Down>", self._on_key_next_action)         # next action
+        # - Ctrl+Up: jump to beginning of current hand
+        self.root.bind("<Control-Up>", self._on_key_hand_start)
+        # - Ctrl+Down: jump to end of current hand
+        self.root.bind("<Control-Down>", self._on_key_hand_end)
+        # - Ctrl+Right: jump to last hand; Ctrl+Left: jump to first hand
+        self.root.bind("<Control-Right>", self._on_key_last_hand)
+        self.root.bind("<Control-Left>", self._on_key_first_hand)
+
+    def _notes_have_focus(self):
+        """True if the notes/mistakes Text widgets currently have focus."""
+        try:
+            focused = self.root.focus_get()
+            return focused is self.notes_text or focused is self.mistakes_text or self._notes_focused
+        except Exception:
+            return self._notes_focused
+
+    # Arrow-key handlers: all ignored while editing notes
+    def _on_key_prev_hand(self, event):
+        if not self._notes_have_focus():
+            self.navigate_hands(-1)
+
+    def _on_key_next_hand(self, event):
+        if not self._notes_have_focus():
+            self.navigate_hands(1)
+
+    def _on_key_prev_action(self, event):
+        if not self._notes_have_focus():
+            self.prev_action()
+
+    def _on_key_next_action(self, event):
+        if not self._notes_have_focus():
+            self.next_action()
+
+    def _on_key_hand_start(self, event):
+        if not self._notes_have_focus():
+            self.jump_to_hand_start()
+
+    def _on_key_hand_end(self, event):
+        if not self._notes_have_focus():
+            self.jump_to_hand_end()
+
+    def _on_key_last_hand(self, event):
+        if self.hands and not self._notes_have_focus():
+            self.select_hand(len(self.hands) - 1)
+
+    def _on_key_first_hand(self, event):
+        if self.hands and not self._notes_have_focus():
+            self.select_hand(0)
+
     def prev_action(self):
         """Navigate to the previous action."""
         if self.current_action_index > 0:
@@ -270,18 +586,9 @@ class HandReplayerGUI:
 
         # SPR (Stack-to-Pot Ratio) — for Hero only, shown below Pot odds
         tk.Label(info_frame, text="SPR:").grid(row=5, column=0, sticky="w")
-        # Ensure the variable exists even if created elsewhere
-        try:
-            self.info_spr_var
-        except AttributeError:
-            self.info_spr_var = tk.StringVar(value=INFO_PLACEHOLDER)
         tk.Label(info_frame, textvariable=self.info_spr_var).grid(row=5, column=1, sticky="w")
         # PTS (Pot-to-Stack %) — for Hero only, aligned right of SPR
         tk.Label(info_frame, text="PTS:").grid(row=5, column=2, sticky="e")
-        try:
-            self.info_pts_var
-        except AttributeError:
-            self.info_pts_var = tk.StringVar(value=INFO_PLACEHOLDER)
         tk.Label(info_frame, textvariable=self.info_pts_var).grid(row=5, column=3, sticky="e")
 
         # Session/Tournament panel (room/game/date/hand/table/bounty)
@@ -417,6 +724,8 @@ class HandReplayerGUI:
         self.hand_selector_frame.pack(side='top', fill='x', padx=(0,10))
         self.hand_selector_canvas = tk.Canvas(self.hand_selector_frame, height=72, bg="#ddd", highlightthickness=0)
         self.hand_selector_canvas.pack(side='top', fill='x', expand=True)
+        # One click binding for the whole selector; the hand is found from the x offset
+        self.hand_selector_canvas.bind("<Button-1>", self.on_hand_selector_click)
         self.hand_boxes = []
 
         # Navigation controls (replay controls) - now under hand selector
@@ -431,6 +740,8 @@ class HandReplayerGUI:
         self.next_button.pack(side='left', padx=2)
         self.last_button = tk.Button(controls_frame, text=">|", command=self.jump_to_hand_end, state='disabled', width=5)
         self.last_button.pack(side='left', padx=2)
+        # Last state pushed to each nav button, so unchanged states skip the Tk config round-trip
+        self._btn_states = {'first': 'disabled', 'prev': 'disabled', 'next': 'disabled', 'last': 'disabled'}
 
         # Stack display mode controls (centered radio buttons with larger targets)
         # Use a dedicated frame and place() to center within controls_frame without disrupting left-aligned widgets.
@@ -468,6 +779,8 @@ class HandReplayerGUI:
         self._update_stack_mode_styles()
 
     def get_seat_positions(self, seats, cx, cy, a, b):
+        if seats == SEATS:
+            return [(cx + a * ux, cy + b * uy) for ux, uy in _SEAT_UNIT_VECS]
         positions = []
         for i in range(seats):
             angle = (2 * math.pi * i) / seats - math.pi / 2
@@ -483,14 +796,12 @@ class HandReplayerGUI:
         
         dx = cx - seat_x
         dy = cy - seat_y
-        dist = math.hypot(dx, dy)
-        if dist == 0:
+        d2 = dx * dx + dy * dy
+        if d2 == 0:
             return seat_x, seat_y
-        nx = dx / dist
-        ny = dy / dist
-        card_x = seat_x + nx * offset_px
-        card_y = seat_y + ny * offset_px
-        return card_x, card_y
+        # Scale the seat->center vector to offset_px with a single division
+        k = offset_px / math.sqrt(d2)
+        return seat_x + dx * k, seat_y + dy * k
 
     def get_centerward_position_fraction(self, seat_x, seat_y, cx, cy, fraction=0.6):
         """Return a point that lies `fraction` of the way from the seat toward the table center."""
@@ -511,21 +822,44 @@ class HandReplayerGUI:
         if not os.path.isdir(png_dir):
             return
 
-        for fname in os.listdir(png_dir):
-            if not fname.lower().endswith(".png"):
-                continue
-            key = os.path.splitext(fname)[0].lower()  # e.g., "ah", "back_blue"
-            self.card_image_paths[key] = os.path.join(png_dir, fname)
+        # Keys are lower-cased file stems, e.g., "ah", "back_blue"
+        with os.scandir(png_dir) as it:
+            self.card_image_paths.update(
+                (e.name[:-4].lower(), e.path)
+                for e in it
+                if e.name.lower().endswith(".png") and e.is_file()
+            )
 
-        # Choose default back
-        if "back_blue" in self.card_image_paths:
-            self.card_back_key = "back_blue"
-        else:
-            # pick any 'back...' image if available
-            for k in self.card_image_paths.keys():
-                if k.startswith("back"):
-                    self.card_back_key = k
-                    break
+        # Choose default back: back_blue if present, otherwise any 'back...' image
+        paths = self.card_image_paths
+        self.card_back_key = (
+            "back_blue" if "back_blue" in paths
+            else next((k for k in paths if k.startswith("back")), None)
+        )
+
+        # With Pillow, decode every PNG once up front so sized images are resized from
+        # memory instead of re-reading and converting the file on the first draw.
+        # Sources are shrunk once (high quality) to 2x the card size; later resizes
+        # from there are cheap bilinear ones.
+        self._card_source_images.clear()
+        if PIL_AVAILABLE:
+            for key, path in paths.items():
+                try:
+                    with Image.open(path) as src:
+                        img = src.convert("RGBA")
+                    img.thumbnail((2 * CARD_WIDTH, 2 * CARD_HEIGHT), Image.LANCZOS)
+                    self._card_source_images[key] = img
+                except Exception:
+                    pass
+
+    def get_seat_card_size(self):
+        """
+        Return (width, height) for hole cards drawn at a seat.
+        Cards never take up more than 50% of the width of the seat box.
+        """
+        max_card_w = SEAT_BOX_WIDTH // 2
+        scale = min(1.0, max(1, max_card_w) / float(CARD_WIDTH))
+        return int(CARD_WIDTH * scale), int(CARD_HEIGHT * scale)
 
     def get_card_image_sized(self, code, width, height):
         """
@@ -533,76 +867,82 @@ class HandReplayerGUI:
         Unknown codes (like '??') or missing assets fall back to the default back image.
         Images are resized to (width x height) via PIL if available, otherwise use tk.PhotoImage unscaled.
         """
-        # Normalize desired key
-        key = None
-        if code and code != "??":
-            key = code.lower()
-        else:
-            key = self.card_back_key
-
-        if not key:
-            return None
-
+        key = code.lower() if code and code != "??" else self.card_back_key
         cache_key = (key, int(width), int(height))
-        if cache_key in self.card_image_cache:
-            return self.card_image_cache[cache_key]
+        photo = self.card_image_cache.get(cache_key)
+        if photo is not None:
+            self.card_image_cache.move_to_end(cache_key)
+        elif key:
+            photo = self._build_card_image(cache_key)
+        return photo
 
+    def _build_card_image(self, cache_key):
+        """Create the PhotoImage for a (key, width, height) cache miss and store it."""
+        key, width, height = cache_key
         path = self.card_image_paths.get(key)
         if not path:
             return None
 
         try:
             if PIL_AVAILABLE:
-                img = Image.open(path).convert("RGBA")
-                img = img.resize((int(width), int(height)), Image.LANCZOS)
+                src = self._card_source_images.get(key)
+                if src is None:
+                    src = Image.open(path).convert("RGBA")
+                img = src.resize((width, height), Image.BILINEAR)
                 photo = ImageTk.PhotoImage(img)
             else:
-                photo = tk.PhotoImage(file=path)
+                photo = self._scale_photo_integer(tk.PhotoImage(file=path), width, height)
         except Exception:
             return None
 
-        self.card_image_cache[cache_key] = photo
+        # Tk keeps no Python reference to a drawn image; evicting here is safe only because
+        # _create_canvas_image stores every drawn photo in self._canvas_images
+        cache = self.card_image_cache
+        cache[cache_key] = photo
+        if len(cache) > CARD_IMAGE_CACHE_SIZE:
+            cache.popitem(last=False)
         return photo
-    def get_card_image(self, code):
+
+    def _scale_photo_integer(self, photo, width, height):
         """
-        Return a PhotoImage for the given card code (e.g., 'Ah', 'Kd').
-        Unknown codes (like '??') or missing assets fall back to the default back image.
-        Images are resized to CARD_WIDTH x CARD_HEIGHT (via PIL if available).
+        Approximate (width x height) without Pillow using Tk's native integer
+        subsample/zoom. One whole-number factor is used for both axes so the
+        card keeps its aspect ratio.
         """
-        # Normalize desired key
-        key = None
-        if code and code != "??":
-            key = code.lower()
-        else:
-            key = self.card_back_key
-
-        # If we still don't have a key, no image is available
-        if not key:
-            return None
-
-        cache_key = (key, CARD_WIDTH, CARD_HEIGHT)
-        if cache_key in self.card_image_cache:
-            return self.card_image_cache[cache_key]
-
-        path = self.card_image_paths.get(key)
-        if not path:
-            return None
-
         try:
-            if PIL_AVAILABLE:
-                img = Image.open(path).convert("RGBA")
-                img = img.resize((CARD_WIDTH, CARD_HEIGHT), Image.LANCZOS)
-                photo = ImageTk.PhotoImage(img)
-            else:
-                # Fallback: no resize support; image should ideally match target size
-                photo = tk.PhotoImage(file=path)
+            src_w, src_h = photo.width(), photo.height()
+            if src_w <= 0 or src_h <= 0 or width <= 0 or height <= 0:
+                return photo
+            if src_w >= width and src_h >= height:
+                factor = max(int(round(src_w / float(width))), int(round(src_h / float(height))))
+                if factor > 1:
+                    return photo.subsample(factor, factor)
+            elif src_w <= width and src_h <= height:
+                factor = min(int(round(width / float(src_w))), int(round(height / float(src_h))))
+                if factor > 1:
+                    return photo.zoom(factor, factor)
         except Exception:
-            return None
-
-        self.card_image_cache[cache_key] = photo
+            pass
         return photo
 
+    def get_card_image(self, code):
+        """
+        Return a PhotoImage for the given card code (e.g., 'Ah', 'Kd') at CARD_WIDTH x CARD_HEIGHT.
+        Unknown codes (like '??') or missing assets fall back to the default back image.
+        """
+        return self.get_card_image_sized(code, CARD_WIDTH, CARD_HEIGHT)
+
     def on_canvas_resize(self, event):
+        """
+        Redraw once the window has stopped changing size for 50ms instead of on every
+        <Configure> event of a drag.
+        """
+        if self._resize_after is not None:
+            self.root.after_cancel(self._resize_after)
+        self._resize_after = self.root.after(50, self._on_resize_settled)
+
+    def _on_resize_settled(self):
+        self._resize_after = None
         self.update_table_canvas()
 
     def open_file(self):
@@ -621,6 +961,13 @@ class HandReplayerGUI:
             for hand in self.hands:
                 hero = (hand or {}).get('hero')
                 self.heroes.append(hero)
+            # Win/loss/fold result and Game # per hand, so the selector and notes never walk the hand dicts
+            self._hand_result = [get_hero_result(h, hero) for h, hero in zip(self.hands, self.heroes)]
+            self._hand_ids = []
+            for hand in self.hands:
+                m = _GAME_NO_RE.search((hand or {}).get('header') or "")
+                self._hand_ids.append(m.group(1) if m else "")
+            self._note_ids = None
             self.file_label.config(text=f"Loaded: {os.path.basename(file_path)}")
             self.populate_hand_selector()
             # Reset UI and load the first hand of the newly opened history.
@@ -633,7 +980,7 @@ class HandReplayerGUI:
             else:
                 # If no hands were found, clear the table and action viewer to avoid stale state.
                 try:
-                    self.table_canvas.delete("all")
+                    self._delete_canvas_items("all")
                 except Exception:
                     pass
         except Exception as e:
@@ -699,10 +1046,60 @@ class HandReplayerGUI:
         except Exception:
             pass
 
+    def on_hand_selector_click(self, event):
+        """
+        Select the hand whose box lies under the click. Boxes are laid out on a fixed
+        grid, so the index is computed directly from the canvas coordinates.
+        """
+        try:
+            x = self.hand_selector_canvas.canvasx(event.x)
+            y = self.hand_selector_canvas.canvasy(event.y)
+        except Exception:
+            x, y = event.x, event.y
+        box_w = self._selector_box_w
+        gap = self._selector_gap
+        y0 = self._selector_y_base
+        if not (y0 <= y <= y0 + self._selector_box_h):
+            return
+        idx, offset = divmod(int(x) - gap, box_w + gap)
+        # Ignore clicks that land in the gap between boxes
+        if offset > box_w or not (0 <= idx < len(self.hands)):
+            return
+        self.select_hand(idx)
+
     def populate_hand_selector(self):
+        """
+        Show one box per loaded hand. The boxes and tick labels are only rebuilt when the
+        number of hands changes; otherwise the existing boxes are recolored in place.
+        """
+        if len(self.hand_boxes) != len(self.hands):
+            self._build_selector()
+        else:
+            # Same layout: only the '#' markers and the selection outline need resetting
+            self.hand_selector_canvas.delete("hand_note_mark")
+            self.hand_note_markers.clear()
+            if self._selector_highlight is not None:
+                self.hand_selector_canvas.itemconfig(
+                    self.hand_boxes[self._selector_highlight], width=1, outline="#333")
+                self._selector_highlight = None
+
+        self._refresh_selector_colors()
+
+        # Ensure note markers render immediately after the selector is fully drawn.
+        try:
+            # Schedule after idle so canvas items exist before we place markers
+            self.root.after_idle(self.refresh_all_note_markers)
+        except Exception:
+            # Fallback: do it synchronously
+            pass
+
+    def _build_selector(self):
+        """Create the selector boxes, tick labels and scroll region for len(self.hands) hands."""
         self.hand_selector_canvas.delete("all")
         self.hand_boxes.clear()
         self.hand_note_markers.clear()
+        self._selector_colors = []
+        self._selector_highlight = None
         # Keep original width; double the height, and leave room above for tick labels
         box_w = 26
         box_h = 52
@@ -716,28 +1113,14 @@ class HandReplayerGUI:
         self._selector_gap = gap
         self._selector_y_base = y
 
-        # Pre-compute which hands have notes in DB (by Game #)
-        hand_ids = []
-        for hand in self.hands:
-            header = (hand or {}).get('header') or ""
-            meta = self._extract_session_info(header)
-            hand_ids.append(meta.get("hand_no") or "")
-        hands_with_notes = self._hands_with_notes_set(hand_ids) if hand_ids else set()
-        
-        for i, hand in enumerate(self.hands):
-            hero = self.heroes[i] if i < len(self.heroes) else (hand.get('hero') if hand else None)
-            result = get_hero_result(hand, hero)
-            color = "#a9a9a9"
-            if result > 0:
-                color = "#66cc66"
-            elif result < 0:
-                color = "#e76c6c"
+        # Boxes start uncolored; _refresh_selector_colors fills them in
+        for i in range(len(self.hands)):
             x = i * (box_w + gap) + gap
             rect_id = self.hand_selector_canvas.create_rectangle(
-                x, y, x + box_w, y + box_h, fill=color, outline="#333", width=1
+                x, y, x + box_w, y + box_h, fill="", outline="#333", width=1
             )
-            self.hand_selector_canvas.tag_bind(rect_id, "<Button-1>", lambda e, idx=i: self.select_hand(idx))
             self.hand_boxes.append(rect_id)
+            self._selector_colors.append("")
 
         # Markers every 10 hands (above the boxes), label 10, 20, 30, ... (omit 1)
         for i in range(9, len(self.hands), 10):  # zero-based index 9 => hand #10
@@ -758,20 +1141,23 @@ class HandReplayerGUI:
         else:
             if hasattr(self, 'selector_scroll'):
                 self.selector_scroll.pack_forget()
-        # Ensure note markers render immediately after the selector is fully drawn.
-        try:
-            # Schedule after idle so canvas items exist before we place markers
-            self.root.after_idle(self.refresh_all_note_markers)
-        except Exception:
-            # Fallback: do it synchronously
-            pass
+
+    def _refresh_selector_colors(self):
+        """Recolor only the selector boxes whose hero result color differs from what is shown."""
+        colors = self._selector_colors
+        for i, result in enumerate(self._hand_result):
+            color = "#a9a9a9"
+            if result > 0:
+                color = "#66cc66"
+            elif result < 0:
+                color = "#e76c6c"
+            if colors[i] != color:
+                colors[i] = color
+                self.hand_selector_canvas.itemconfig(self.hand_boxes[i], fill=color)
 
     def select_hand(self, idx):
         # Auto-save notes for the currently selected hand (if any changes)
-        try:
-            prev_idx = getattr(self, 'current_hand_index', None)
-        except Exception:
-            prev_idx = None
+        prev_idx = self.current_hand_index
         if prev_idx is not None and 0 <= prev_idx < len(self.hands):
             self.maybe_auto_save_notes_for_hand(prev_idx)
 
@@ -789,6 +1175,7 @@ class HandReplayerGUI:
         self.current_street = 'preflop'
         self.current_action_index = 0
         self._last_action_index = None
+        self._reset_stream_state()
 
         # Reveal hero hole cards immediately if available
         # ft_hand_parser stores:
@@ -798,12 +1185,12 @@ class HandReplayerGUI:
         hole = hand.get('hole_cards')
         if hero_name and hole:
             # Split on whitespace or commas to be robust
-            parts = [p.strip() for p in re.split(r'[\s,]+', hole) if p.strip()]
+            parts = hole.replace(',', ' ').split()
             if len(parts) >= 2:
                 self.player_cards[hero_name] = parts[:2]
 
         self.update_table_canvas()
-        self.update_action_viewer()
+        self.update_action_viewer(force=True)
 
         # Update session/tournament panel (constant across the tournament/file)
         self.update_session_panel()
@@ -812,11 +1199,13 @@ class HandReplayerGUI:
         self.process_initial_forced_bets(hand)
 
         self.display_action_history()
-        for i, rect_id in enumerate(self.hand_boxes):
-            if i == idx:
-                self.hand_selector_canvas.itemconfig(rect_id, width=5, outline="#222")
-            else:
-                self.hand_selector_canvas.itemconfig(rect_id, width=1, outline="#333")
+        # Only the previously highlighted box and the new one change outline
+        prev_hl = self._selector_highlight
+        if prev_hl is not None and prev_hl != idx and prev_hl < len(self.hand_boxes):
+            self.hand_selector_canvas.itemconfig(self.hand_boxes[prev_hl], width=1, outline="#333")
+        if idx < len(self.hand_boxes):
+            self.hand_selector_canvas.itemconfig(self.hand_boxes[idx], width=5, outline="#222")
+            self._selector_highlight = idx
 
         # Load notes for the newly selected hand
         self.load_notes_for_current_hand()
@@ -837,22 +1226,26 @@ class HandReplayerGUI:
 
         # Reset contributions and pot for this hand
         self.pot = 0
-        self.player_contributions = {p['name']: 0 for p in hand['players']}
+        self.player_contributions = dict.fromkeys(hand['_player_names'], 0)
 
         # Process forced bets sequentially
+        start_index = self.current_action_index
         for act in preflop_actions:
             if act['action'] in ('posts', 'antes'):
                 # Replay the action
                 self.process_action(act, self.player_contributions)
 
                 # Check if this is the BB post
-                if "big blind" in act['detail'].lower():
+                if "big blind" in act['_detail_lower']:
                     break  # Stop processing at the BB post
 
-                # Update the current action index and display the state
+                # Advance the current action index
                 self.current_action_index += 1
-                self.update_action_viewer()
-                self.update_table_canvas()
+
+        # Display the state once for the final position (intermediate positions are never seen)
+        if self.current_action_index != start_index:
+            self.update_action_viewer()
+            self.update_table_canvas()
 
         # Debugging: Log the final state
         #print(f"Pot after forced bets: {self.pot}")
@@ -865,35 +1258,9 @@ class HandReplayerGUI:
           - Antes add to the pot but do NOT count toward the street contribution.
           - Blinds (posts) add to both the pot and street contribution.
         """
-        action = act['action']
-        detail = act.get('detail', '')
-        player = act['player']
-        
-        if action in ('checks', 'folds', 'shows', 'mucks', 'collected', 'wins', 'is sitting out', 'has returned'):
-            return
-        if action == 'posts':
-            # Blinds and similar forced posts: count in both pot and street contribution
-            amt = self._extract_first_amount(detail)
-            self.pot += amt
-            contrib[player] = contrib.get(player, 0) + amt
-        elif action == 'antes':
-            # Antes: pot only, excluded from street contribution
-            amt = self._extract_first_amount(detail)
-            self.pot += amt
-        elif action == 'bets':
-            amt = self._extract_first_amount(detail)
-            self.pot += amt
-            contrib[player] = contrib.get(player, 0) + amt
-        elif action == 'calls':
-            amt = self._extract_first_amount(detail)
-            self.pot += amt
-            contrib[player] = contrib.get(player, 0) + amt
-        elif action == 'raises':
-            target_total = self._extract_raise_to_amount(detail)
-            prev = contrib.get(player, 0)
-            delta = max(0, target_total - prev)
-            self.pot += delta
-            contrib[player] = prev + delta
+        handler = _ACTION_HANDLERS.get(act['action'])
+        if handler is not None:
+            handler(self, act, contrib)
 
     def add_to_pot(self, player, amount):
         """
@@ -903,81 +1270,157 @@ class HandReplayerGUI:
         self.player_contributions = getattr(self, 'player_contributions', {})
         self.player_contributions[player] = self.player_contributions.get(player, 0) + amount
 
-    def update_table_canvas(self):
-        self.table_canvas.delete("all")
-        # Reset cached image refs for this frame to prevent growth
-        if hasattr(self, "_canvas_images"):
+    def _create_canvas_image(self, x, y, photo, anchor="nw", **kwargs):
+        """
+        Create an image item on the table canvas and keep its PhotoImage alive
+        for as long as the item exists (Tk does not hold a Python reference).
+        """
+        item_id = self.table_canvas.create_image(x, y, image=photo, anchor=anchor, **kwargs)
+        self._canvas_images[item_id] = photo
+        return item_id
+
+    def _delete_canvas_items(self, tag_or_id):
+        """
+        Delete table canvas items and release the PhotoImages tied to them.
+        """
+        if tag_or_id == "all":
             self._canvas_images.clear()
+            self._table_layer_keys.clear()
+        else:
+            self._table_layer_keys.pop(tag_or_id, None)
+            try:
+                for item_id in self.table_canvas.find_withtag(tag_or_id):
+                    self._canvas_images.pop(item_id, None)
+            except Exception:
+                pass
+        self.table_canvas.delete(tag_or_id)
+
+    def update_table_canvas(self):
+        """
+        Redraw the table for the current position.
+        The canvas is split into layers (table, one per seat, board, pot, bet/ante/winnings
+        markers). Each layer remembers the inputs it was drawn from and is only recreated
+        when those change, so stepping through a hand touches just the seats and markers
+        that actually moved. A canvas resize starts over from an empty canvas.
+        """
         width = self.table_canvas.winfo_width()
         height = self.table_canvas.winfo_height()
+        # Not realized yet (Tk reports 1x1); the <Configure> on mapping triggers the first draw
+        if width <= 1 or height <= 1:
+            return
         cx = width // 2
         cy = height // 2
         table_a = int(0.43 * width)
         table_b = int(0.39 * height)
-        self.table_canvas.create_oval(
+        if self._table_layer_keys.get('geometry') != (width, height):
+            self._delete_canvas_items("all")
+            self._table_layer_keys['geometry'] = (width, height)
+            # Seat positions and marker anchors only depend on the canvas size
+            self._seat_positions = self.get_seat_positions(SEATS, cx, cy, table_a, table_b)
+            self._bet_anchors = [self.get_centerward_position_fraction(sx, sy, cx, cy, fraction=0.30)
+                                 for sx, sy in self._seat_positions]
+            self._ante_anchors = [self.get_centerward_position_fraction(sx, sy, cx, cy, fraction=0.38)
+                                  for sx, sy in self._seat_positions]
+            self._win_anchors = [self.get_centerward_position_fraction(sx, sy, cx, cy, fraction=0.22)
+                                 for sx, sy in self._seat_positions]
+        seat_positions = self._seat_positions
+        hand = self.hands[self.current_hand_index] if self.hands and self.current_hand_index is not None else None
+        seat_map = self._get_seat_map(hand)
+        name_to_seat = self._name_to_seat
+
+        # Layers are drawn bottom to top. Once a layer is recreated (and thus placed on top),
+        # every layer above it is raised again to restore the stacking order.
+        restack = False
+
+        def layer(name, key, draw):
+            nonlocal restack
+            if self._draw_table_layer(name, key, draw):
+                restack = True
+            elif restack:
+                self.table_canvas.tag_raise(name)
+
+        layer('table', None, lambda: self.table_canvas.create_oval(
             cx - table_a, cy - table_b,
             cx + table_a, cy + table_b,
             fill="#005500", outline="#333", width=4
-        )
-        seat_positions = self.get_seat_positions(SEATS, cx, cy, table_a, table_b)
-        hand = self.hands[self.current_hand_index] if self.hands and self.current_hand_index is not None else None
-        seat_map = {p['seat']: p for p in hand['players']} if hand else {}
+        ))
 
-        # Compute live chip stacks up to the current action, so seat chip counts reflect
-        # bets/calls/raises/blinds/antes and winnings, both when stepping forward and back.
-        stacks_map = {p['name']: p.get('chips', 0) for p in hand['players']} if hand else {}
+        # Running pot/board/contribution/stack state up to the current action
+        stream = None
         if hand and self.current_street is not None and self.current_action_index is not None:
-            try:
-                stacks_map = self.compute_stacks_upto(
-                    hand,
-                    self.current_street,
-                    self.current_action_index
-                )
-            except Exception:
-                pass
+            stream = self._get_stream_state(hand, self.current_street, self.current_action_index)
+
+        # Live chip stacks up to the current action, so seat chip counts reflect
+        # bets/calls/raises/blinds/antes and winnings, both when stepping forward and back.
+        if stream is not None:
+            stacks_map = stream['stacks']
+        else:
+            stacks_map = {p['name']: p.get('chips', 0) for p in hand['players']} if hand else {}
 
         flash = self.seat_action_flash  # e.g., {'name': 'Player1', 'text': 'BET'}
+        flash_name = flash.get('name') if flash else None
+        # Per-frame lookups hoisted out of the seat loop
+        folded = self.folded_players
+        sitting_out = self.sitting_out_players
+        player_cards = self.player_cards
+        button_seat = hand.get('button_seat') if hand else None
         for seat in range(1, SEATS + 1):
             x, y = seat_positions[seat - 1]
-            r = SEAT_RADIUS
             player = seat_map.get(seat)
+            is_button = button_seat == seat
             if player:
-                is_folded = player['name'] in self.folded_players
-                # Compute seat rectangle top (used to tuck cards behind the seat)
-                seat_top = int(y - SEAT_BOX_HEIGHT // 2)
-
-                if not is_folded:
-                    # Draw cards centered on the seat, poking out from behind the seat (only top half visible)
-                    cards = self.player_cards.get(player['name'], ['??', '??'])
-                    self.draw_cards_poking_from_seat(x, seat_top, cards)
-
-                # Draw player name and chips in a fixed-size rounded rectangle centered at the seat position
-                if flash and flash.get('name') == player['name']:
-                    # Show the transient action overlay instead of name/chips
-                    self.draw_seat_action_overlay(x, y, flash.get('text', '').upper())
-                else:
+                name = player['name']
+                cards = None
+                if name not in folded:
+                    cards = tuple(player_cards.get(name, ['??', '??']))
+
+                overlay = None
+                chip_display = None
+                if flash_name == name:
+                    overlay = flash.get('text', '').upper()
+                elif name in sitting_out:
                     # If player is sitting out, replace chip display with "sitting out"
-                    if player['name'] in self.sitting_out_players:
-                        chip_display = "sitting out"
-                    else:
-                        # Dynamic, up-to-now stack for this player, formatted via current display mode
-                        chips_now = stacks_map.get(player['name'], player.get('chips', 0))
-                        try:
-                            chip_display = self._format_stack_display(chips_now, hand)
-                        except Exception:
-                            chip_display = chips_now
-
-                    self.draw_seat_label(x, y, r, player['name'], chip_display, cy)
-
+                    chip_display = "sitting out"
+                else:
+                    # Dynamic, up-to-now stack for this player, formatted via current display mode
+                    chips_now = stacks_map.get(name, player.get('chips', 0))
+                    try:
+                        chip_display = self._format_stack_display(chips_now, hand)
+                    except Exception:
+                        chip_display = chips_now
+                key = (name, cards, overlay, chip_display, is_button)
             else:
-                # Draw an empty seat rectangle (no text) so all seats are visible by default
-                self.draw_empty_seat(x, y)
-
-            # Draw dealer button if this seat holds the button for the current hand
-            if hand and hand.get('button_seat') == seat:
-                # Place the dealer disc slightly toward the table center from the seat
-                # so it sits visually "next to" the player box without clipping.
-                self.draw_dealer_button(x, y, cx, cy)
+                key = (None, is_button)
+
+            def draw_seat(x=x, y=y, player=player, key=key, seat=seat):
+                is_button = key[-1]
+                if player:
+                    name, cards, overlay, chip_display, _ = key
+                    if cards is not None:
+                        # Draw cards centered on the seat, poking out from behind the seat (only top half visible)
+                        seat_top = int(y - SEAT_BOX_HEIGHT // 2)
+                        self.draw_cards_poking_from_seat(x, seat_top, list(cards))
+                    # Draw player name and chips in a fixed-size rounded rectangle centered at the seat position
+                    if overlay is not None:
+                        # Show the transient action overlay instead of name/chips
+                        self.draw_seat_action_overlay(x, y, overlay)
+                    else:
+                        self.draw_seat_label(x, y, SEAT_RADIUS, name, chip_display, cy,
+                                             tags=f"seat{seat}_label")
+                else:
+                    # Draw an empty seat rectangle (no text) so all seats are visible by default
+                    self.draw_empty_seat(x, y)
+                # Draw dealer button if this seat holds the button for the current hand
+                if is_button:
+                    self.draw_dealer_button(x, y, cx, cy)
+
+            # A stack change alone only rewrites the seat's label text
+            old = self._table_layer_keys.get(f"seat{seat}")
+            if (player and old is not None and len(old) == 5 and key[2] is None
+                    and old[:3] == key[:3] and old[4] == key[4]):
+                self._retext_table_layer(f"seat{seat}", key, f"seat{seat}_label",
+                                         self._seat_label_text(key[0], key[3]))
+            layer(f"seat{seat}", key, draw_seat)
 
         # Pot area anchor (used for community card placement and pot text below them)
         pot_radius = int(min(table_a, table_b) * 0.25)
@@ -985,55 +1428,139 @@ class HandReplayerGUI:
         pot_cy = cy + pot_offset_y
 
         # Compute pot size (state up to the current action)
-        pot_amount = 0
-        if hand and self.current_street is not None and self.current_action_index is not None:
-            pot_amount = self.compute_pot_upto(hand, self.current_street, self.current_action_index)
+        pot_amount = stream['pot'] if stream is not None else 0
 
         # Draw community cards revealed up to the current action
-        board_cards = []
-        if hand and self.current_street is not None and self.current_action_index is not None:
-            board_cards = self.compute_board_upto(hand, self.current_street, self.current_action_index)
-            self.draw_community_cards(board_cards, cx, pot_cy, pot_radius)
+        board_cards = list(stream['board']) if stream is not None else []
+        layer('board', tuple(board_cards),
+              lambda: self.draw_community_cards(board_cards, cx, pot_cy, pot_radius))
 
         # Place the POT label and amount just below the community cards
         # Use the same positioning math as draw_community_cards to find the bottom edge
         top_margin = 10
-        w = CARD_WIDTH
         h = CARD_HEIGHT
         cards_top = int((pot_cy - pot_radius) - h - top_margin)
         cards_bottom = cards_top + h
         # Slightly larger fonts and extra spacing between label and amount
         pot_label_y = cards_bottom + 8
         amount_y = pot_label_y + 42  # extra padding between "POT" and the amount
-        self.table_canvas.create_text(
-            cx, pot_label_y, text="POT", fill="white", font=("Arial", 13, "bold")
-        )
-        self.table_canvas.create_text(
-            cx, amount_y, text=f"${pot_amount:,}", fill="white", font=("Arial", 14, "bold")
-        )
-        
-        # Compute and draw current street bet/contribution markers
-        if hand and self.current_street is not None and self.current_action_index is not None:
-            non_ante_contrib, ante_contrib = self.compute_street_contrib_upto(
-                hand, self.current_street, self.current_action_index
+
+        def draw_pot():
+            self.table_canvas.create_text(
+                cx, pot_label_y, text="POT", fill="white", font=("Arial", 13, "bold")
             )
+            self.table_canvas.create_text(
+                cx, amount_y, text=f"${pot_amount:,}", fill="white", font=("Arial", 14, "bold"),
+                tags="pot_amount"
+            )
+
+        if 'pot' in self._table_layer_keys:
+            self._retext_table_layer('pot', pot_amount, "pot_amount", f"${pot_amount:,}")
+        layer('pot', pot_amount, draw_pot)
+
+        # Compute current street bet/contribution markers
+        non_ante_contrib, ante_contrib, winnings_map = {}, {}, {}
+        if stream is not None:
             # If showdown has started, clear any existing bets by skipping bet markers
+            if not stream['showdown']:
+                non_ante_contrib = stream['contrib']
+            ante_contrib = stream['ante_contrib']
+            winnings_map = stream['winnings']
+
+        def marker_key(amounts):
+            # Only placed markers affect the drawing
+            return tuple(
+                (name, name_to_seat.get(name), amount)
+                for name, amount in amounts.items()
+                if amount > 0 and name_to_seat.get(name)
+            )
+
+        # Drawn marker layers are patched per seat in place; only a first draw builds the layer
+        bets_key = marker_key(non_ante_contrib)
+        antes_key = marker_key(ante_contrib)
+        wins_key = marker_key(winnings_map)
+        # The keys already hold the placed (name, seat, amount) entries, so they are drawn directly
+        for marker_layer, key in (('bets', bets_key), ('antes', antes_key), ('wins', wins_key)):
+            if self._update_marker_layer(marker_layer, key):
+                restack = True
+            layer(marker_layer, key, lambda m=marker_layer, k=key: self.draw_chip_markers(m, k))
+
+    def _draw_table_layer(self, layer, key, draw):
+        """
+        (Re)draw one table layer if its key changed since it was last drawn.
+        Items created by draw() are tagged with the layer name so the layer can be
+        deleted or raised as a unit. Returns True if the layer was redrawn.
+        """
+        if layer in self._table_layer_keys and self._table_layer_keys[layer] == key:
+            return False
+        self._delete_canvas_items(layer)
+        n_before = len(self.table_canvas.find_all())
+        try:
+            draw()
+        finally:
+            # New items are always created on top of the display list
+            for item_id in self.table_canvas.find_all()[n_before:]:
+                self.table_canvas.addtag_withtag(layer, item_id)
+        self._table_layer_keys[layer] = key
+        return True
+
+    def _retext_table_layer(self, layer, key, tag, text):
+        """
+        Update a drawn layer whose new key differs only in one text item: reconfigure the
+        item tagged `tag` in place and record `key`, so the layer is not recreated.
+        """
+        if self._table_layer_keys.get(layer) == key:
+            return
+        self.table_canvas.itemconfigure(tag, text=text)
+        self._table_layer_keys[layer] = key
+
+    def _update_marker_layer(self, layer, key):
+        """
+        Bring an already drawn chip-marker layer keyed by ((name, seat, amount), ...) up to
+        `key` in place: markers of seats that dropped out are deleted, changed amounts are
+        retexted and markers for new seats are created, so the layer is not recreated.
+        Returns True if items were created (they land on top of the display list).
+        """
+        old = self._table_layer_keys.get(layer)
+        if old is None or old == key:
+            return False
+        canvas = self.table_canvas
+        old_amounts = {seat: amount for _name, seat, amount in old}
+        new_seats = {seat for _name, seat, _amount in key}
+        for seat in old_amounts:
+            if seat not in new_seats:
+                canvas.delete(f"{layer}_chip{seat}")
+        added = []
+        for entry in key:
+            seat, amount = entry[1], entry[2]
+            if seat not in old_amounts:
+                added.append(entry)
+            elif old_amounts[seat] != amount:
+                canvas.itemconfigure(f"{layer}_{seat}", text=f"{amount:,}")
+        if added:
+            n_before = len(canvas.find_all())
             try:
-                showdown_reached = self.has_showdown_upto(hand, self.current_street, self.current_action_index)
-            except Exception:
-                showdown_reached = False
-            if not showdown_reached:
-                # Draw blind/bet/call/raise markers (green)
-                self.draw_bet_markers(non_ante_contrib, seat_positions, seat_map, cx, cy)
-            # Ante markers (brown, slightly more center)
-            # Draw ante markers (brown, slightly more center)
-            self.draw_ante_markers(ante_contrib, seat_positions, seat_map, cx, cy)
-            # Draw winnings markers (gold) accumulated up to the current action
-            try:
-                winnings_map = self.compute_winnings_upto(hand, self.current_street, self.current_action_index)
-                self.draw_winnings_markers(winnings_map, seat_positions, seat_map, cx, cy)
-            except Exception:
-                pass
+                self.draw_chip_markers(layer, added)
+            finally:
+                for item_id in canvas.find_all()[n_before:]:
+                    canvas.addtag_withtag(layer, item_id)
+        self._table_layer_keys[layer] = key
+        return bool(added)
+
+    def _get_seat_map(self, hand):
+        """
+        Return {seat: player} for the hand and point self._name_to_seat at its inverse.
+        Both maps are built once per hand and cached on the hand dict.
+        """
+        if not hand:
+            self._name_to_seat = {}
+            return {}
+        seat_map = hand.get('_seat_map')
+        if seat_map is None:
+            seat_map = hand['_seat_map'] = {p['seat']: p for p in hand['players']}
+            hand['_name_to_seat'] = {pdata['name']: seat for seat, pdata in seat_map.items()}
+        self._name_to_seat = hand['_name_to_seat']
+        return seat_map
 
     def draw_cards(self, x, y, cards, seat_y=None, cy=None):
         card_width = CARD_WIDTH
@@ -1057,15 +1584,13 @@ class HandReplayerGUI:
         back_dy = -int(card_height * 0.10)  # raise ~10% of height
 
         # Helper to draw a single card (image first, fallback to rectangle+text)
+        get_sized = self.get_card_image_sized
+        create_image = self._create_canvas_image
+
         def draw_one(left, top, code):
-            img = getattr(self, "get_card_image", None)
-            photo = img(code) if callable(img) else None
+            photo = get_sized(code, card_width, card_height)
             if photo is not None:
-                self.table_canvas.create_image(left, top, image=photo, anchor="nw")
-                # prevent GC of PhotoImage
-                if not hasattr(self, "_canvas_images"):
-                    self._canvas_images = []
-                self._canvas_images.append(photo)
+                create_image(left, top, photo)
             else:
                 # Fallback to simple rectangle + code text
                 self.table_canvas.create_rectangle(
@@ -1099,11 +1624,7 @@ class HandReplayerGUI:
         if not cards:
             return
         # Enforce: cards should never take up more than 50% of the width of the seat
-        max_card_w = SEAT_BOX_WIDTH // 2
-        # Scale card size down if needed to satisfy seat constraint
-        scale = min(1.0, max(1, max_card_w) / float(CARD_WIDTH))
-        w = int(CARD_WIDTH * scale)
-        h = int(CARD_HEIGHT * scale)
+        w, h = self.get_seat_card_size()
 
         # Front card centered on seat; top positioned so half the card height sits above seat top
         front_left = int(seat_cx - w // 2)
@@ -1115,14 +1636,14 @@ class HandReplayerGUI:
         back_dx = -int(w * 0.20)
         back_dy = -int(h * 0.06)
 
+        get_sized = self.get_card_image_sized
+        create_image = self._create_canvas_image
+
         def draw_one(left, top, code):
             # Use sized image for per-seat scaling
-            photo = self.get_card_image_sized(code, w, h)
+            photo = get_sized(code, w, h)
             if photo is not None:
-                self.table_canvas.create_image(left, top, image=photo, anchor="nw")
-                if not hasattr(self, "_canvas_images"):
-                    self._canvas_images = []
-                self._canvas_images.append(photo)
+                create_image(left, top, photo)
             else:
                 self.table_canvas.create_rectangle(left, top, left + w, top + h, fill="#fff", outline="#000", width=2)
                 self.table_canvas.create_text(left + w // 2, top + h // 2, text=code, font=("Arial", 18, "bold"))
@@ -1130,13 +1651,57 @@ class HandReplayerGUI:
         if len(cards) >= 2:
             back_code = cards[0] if cards[0] else "??"
             front_code = cards[1] if cards[1] else "??"
+            # With Pillow, both cards go out as one pre-composited image item
+            pair = self.get_hole_pair_image(back_code, front_code, w, h, back_dx, back_dy)
+            if pair is not None:
+                self._create_canvas_image(front_left + back_dx, front_top + back_dy, pair)
+                return
             # Draw back first so it appears beneath
             draw_one(front_left + back_dx, front_top + back_dy, back_code)
             draw_one(front_left, front_top, front_code)
         else:
             code = cards[0] if cards[0] else "??"
 
-    def draw_seat_label(self, x, y, r, name, chips, cy):
+    def get_hole_pair_image(self, back_code, front_code, w, h, dx, dy):
+        """
+        Return one PhotoImage with the back card at the top-left and the front card offset
+        by (-dx, -dy) over it, i.e. the layout of draw_cards_poking_from_seat.
+        Returns None if Pillow is unavailable or either card image is missing.
+        """
+        if not PIL_AVAILABLE:
+            return None
+        keys = tuple(c.lower() if c and c != "??" else self.card_back_key for c in (back_code, front_code))
+        cache_key = (keys, w, h, dx, dy)
+        cache = self._hole_pair_cache
+        photo = cache.get(cache_key)
+        if photo is not None:
+            cache.move_to_end(cache_key)
+            return photo
+
+        try:
+            sources = [self._card_source_images.get(k) for k in keys]
+            if None in sources:
+                return None
+            composite = Image.new("RGBA", (w - dx, h - dy), (0, 0, 0, 0))
+            composite.alpha_composite(sources[0].resize((w, h), Image.BILINEAR), (0, 0))
+            composite.alpha_composite(sources[1].resize((w, h), Image.BILINEAR), (-dx, -dy))
+            photo = ImageTk.PhotoImage(composite)
+        except Exception:
+            return None
+
+        cache[cache_key] = photo
+        if len(cache) > HOLE_PAIR_CACHE_SIZE:
+            cache.popitem(last=False)
+        return photo
+
+    def _seat_label_text(self, name, chips):
+        """Two-line seat label: name, then chips ($-prefixed only for numeric values)."""
+        # Only prefix with $ for numeric chip values; for status strings like "sitting out" don't add $.
+        if isinstance(chips, (int, float)):
+            return f"{name}\n${chips}"
+        return f"{name}\n{chips}"
+
+    def draw_seat_label(self, x, y, r, name, chips, cy, tags=()):
         """Draw a fixed-size rounded black box with thick dark gray border, centered at seat position."""
         # Fixed rectangle centered at (x, y)
         left = int(x - SEAT_BOX_WIDTH // 2)
@@ -1145,22 +1710,13 @@ class HandReplayerGUI:
         bottom = top + SEAT_BOX_HEIGHT
 
         # Rounded seat rectangle (draw first so cards can tuck behind its bottom half)
-        self.draw_rounded_rect(left, top, right, bottom,
-                               radius=SEAT_BORDER_RADIUS,
-                               fill="black",
-                               outline=SEAT_BORDER_COLOR,
-                               width=SEAT_BORDER_WIDTH)
+        self.draw_seat_box(left, top, right, bottom, fill="black")
 
         # Centered text atop the rectangle
-        # Only prefix with $ for numeric chip values; for status strings like "sitting out" don't add $.
-        if isinstance(chips, (int, float)):
-            chips_str = f"${chips}"
-        else:
-            chips_str = str(chips)
-        label_text = f"{name}\n{chips_str}"
         # Ensure the text itself is centered within the seat (for multi-line text as well)
         self.table_canvas.create_text(
-            x, y, text=label_text, font=("Arial", 12, "bold"), fill="white", anchor="center", justify="center"
+            x, y, text=self._seat_label_text(name, chips), font=("Arial", 12, "bold"), fill="white",
+            anchor="center", justify="center", tags=tags
         )
     def draw_seat_action_overlay(self, x, y, text):
         """Draw a fixed-size rounded black box with bold, large overlay text (e.g., BET, CALL)."""
@@ -1170,11 +1726,7 @@ class HandReplayerGUI:
         bottom = top + SEAT_BOX_HEIGHT
 
         # Background same as occupied seat
-        self.draw_rounded_rect(left, top, right, bottom,
-                               radius=SEAT_BORDER_RADIUS,
-                               fill="black",
-                               outline=SEAT_BORDER_COLOR,
-                               width=SEAT_BORDER_WIDTH)
+        self.draw_seat_box(left, top, right, bottom, fill="black")
         # Big overlay text
         overlay = text.upper() if text else ""
         self.table_canvas.create_text(x, y, text=overlay, font=("Arial", 20, "bold"), fill="#ffffff", anchor="center")
@@ -1187,13 +1739,7 @@ class HandReplayerGUI:
         bottom = top + SEAT_BOX_HEIGHT
 
         # Rounded seat rectangle (same style as occupied seats)
-        self.draw_rounded_rect(
-            left, top, right, bottom,
-            radius=SEAT_BORDER_RADIUS,
-            fill="",
-            outline=SEAT_BORDER_COLOR,
-            width=SEAT_BORDER_WIDTH
-        )
+        self.draw_seat_box(left, top, right, bottom, fill="")
 
     def draw_dealer_button(self, seat_x, seat_y, cx, cy, radius=DEALER_BTN_RADIUS):
         """
@@ -1242,6 +1788,44 @@ class HandReplayerGUI:
 
 # ====== Action flash control ======
 
+    def draw_seat_box(self, left, top, right, bottom, fill=""):
+        """
+        Draw the rounded seat rectangle. With Pillow this is one image item from a sprite
+        rendered once per fill color; otherwise it falls back to draw_rounded_rect.
+        """
+        sprite = self._get_seat_sprite(fill)
+        if sprite is not None:
+            # The Tk outline straddles the box edge, so the sprite extends half a border outward
+            half = SEAT_BORDER_WIDTH // 2
+            self._create_canvas_image(left - half, top - half, sprite)
+            return
+        self.draw_rounded_rect(left, top, right, bottom,
+                               radius=SEAT_BORDER_RADIUS,
+                               fill=fill,
+                               outline=SEAT_BORDER_COLOR,
+                               width=SEAT_BORDER_WIDTH)
+
+    def _get_seat_sprite(self, fill):
+        """Return the cached seat box PhotoImage for `fill` ("" = transparent), or None without Pillow."""
+        if not PIL_AVAILABLE:
+            return None
+        sprite = self._seat_sprites.get(fill)
+        if sprite is None:
+            try:
+                bw = SEAT_BORDER_WIDTH
+                img = Image.new("RGBA", (SEAT_BOX_WIDTH + bw, SEAT_BOX_HEIGHT + bw), (0, 0, 0, 0))
+                ImageDraw.Draw(img).rounded_rectangle(
+                    (0, 0, SEAT_BOX_WIDTH + bw - 1, SEAT_BOX_HEIGHT + bw - 1),
+                    radius=SEAT_BORDER_RADIUS + bw // 2,
+                    fill=fill or None,
+                    outline=SEAT_BORDER_COLOR,
+                    width=bw,
+                )
+                sprite = self._seat_sprites[fill] = ImageTk.PhotoImage(img)
+            except Exception:
+                return None
+        return sprite
+
     def draw_rounded_rect(self, x1, y1, x2, y2, radius=12, fill="", outline="", width=1):
         """
         Draw a rounded rectangle on the canvas using 4 arcs + 3 rectangles.
@@ -1310,7 +1894,7 @@ class HandReplayerGUI:
         """
         if not text:
             return 0
-        m = re.search(r'(\d[\d,]*)', text)
+        m = _FIRST_AMOUNT_RE.search(text)
         if not m:
             return 0
         return int(m.group(1).replace(',', ''))
@@ -1322,7 +1906,7 @@ class HandReplayerGUI:
         """
         if not text:
             return 0
-        m = re.search(r'raises\s+to\s+(\d[\d,]*)', text)
+        m = _RAISE_TO_RE.search(text)
         if m:
             return int(m.group(1).replace(',', ''))
         # Fallback
@@ -1336,12 +1920,29 @@ class HandReplayerGUI:
         """
         if not detail:
             return None
-        m = re.search(r"returned\s+to\s+(.+)$", detail, flags=re.IGNORECASE)
+        m = _RETURNED_TO_RE.search(detail)
         if not m:
             return None
         name = m.group(1).strip()
-        name = re.sub(r"[.\s]+$", "", name)  # trim trailing punctuation/whitespace
+        name = _TRAILING_PUNCT_RE.sub("", name)  # trim trailing punctuation/whitespace
         return name
+    def _parsed(self, act):
+        """
+        Return the amounts parsed from an action's detail string, memoized on the
+        action dict so repeated replays of the same action skip the regex work.
+        Keys: 'amt' (first amount), 'raise_to' ('raises to' total), 'returned_to' (uncalled recipient).
+        """
+        parsed = act.get('_parsed')
+        if parsed is None:
+            detail = act.get('detail', '') or ''
+            parsed = {
+                'amt': self._extract_first_amount(detail),
+                'raise_to': self._extract_raise_to_amount(detail) if act.get('action') == 'raises' else 0,
+                'returned_to': self._extract_returned_to_name(detail) if act.get('action') == 'uncalled' else None,
+            }
+            act['_parsed'] = parsed
+        return parsed
+
     def compute_pot_upto(self, hand, target_street: str, target_action_index: int) -> int:
         """
         Recompute pot from the start of the hand up to and including the given action index
@@ -1351,74 +1952,252 @@ class HandReplayerGUI:
           - bets
           - calls
           - raises (using 'raises to' delta based on per-street contribution)
+        Uses a per-hand prefix array (built on first use) so each lookup is O(1).
+        """
+        prefix = hand.get('_pot_prefix')
+        if prefix is None:
+            prefix = self._build_pot_prefix(hand)
+        if target_street not in prefix:
+            # Unknown street: the whole hand's pot
+            return prefix['river'][-1]
+        pots = prefix[target_street]
+        return pots[max(0, min(target_action_index + 1, len(pots) - 1))]
+
+    def _build_pot_prefix(self, hand):
+        """
+        Sweep the hand once and store hand['_pot_prefix'] = {street: [pot after 0, 1, ... n actions]}.
+        Each street is reduced to a list of per-action pot deltas, then prefix-summed in one
+        itertools.accumulate pass.
         """
         pot = 0
-        streets = ['preflop', 'flop', 'turn', 'river']
+        prefix = {}
+        player_idx = hand['_player_idx']
 
-        # Helper: process one action with street contribution tracking
-        def process_action(act, contrib):
-            nonlocal pot
+        # Helper: pot delta of one action, with street contribution tracking.
+        # Chips from names that aren't seated (chat lines parsed as actions) are ignored.
+        def pot_delta(act, contrib):
             action = act['action']
-            detail = act.get('detail', '')
             player = act['player']
             if action in ('checks', 'folds', 'shows', 'mucks', 'collected', 'wins', 'is sitting out', 'has returned'):
-                return
-            # Money-adding actions
-            if action == 'posts' or action == 'antes':
-                # Includes blinds and antes
-                amt = self._extract_first_amount(detail)
-                pot += amt
-                contrib[player] = contrib.get(player, 0) + amt
-            elif action == 'bets':
-                amt = self._extract_first_amount(detail)
-                pot += amt
-                contrib[player] = contrib.get(player, 0) + amt
-            elif action == 'calls':
-                amt = self._extract_first_amount(detail)
-                pot += amt
-                contrib[player] = contrib.get(player, 0) + amt
-            elif action == 'raises':
-                target_total = self._extract_raise_to_amount(detail)
-                prev = contrib.get(player, 0)
-                delta = max(0, target_total - prev)
-                pot += delta
-                contrib[player] = prev + delta
-            else:
-                # Money-returning action(s)
-                if action == 'uncalled':
-                    # Return chips to the bettor: subtract from pot and reduce that player's street contrib
-                    amt = self._extract_first_amount(detail)
-                    pot -= amt
-                    # Determine recipient (use explicit player if present; else parse from detail)
-                    recipient = player or self._extract_returned_to_name(detail)
-                    if recipient:
-                        prev = contrib.get(recipient, 0)
-                        contrib[recipient] = max(0, prev - amt)
-                else:
-                    # Any other verbs can be added here if they appear
-                    pass
+                return 0
+            # Money-adding actions (blinds, antes, bets, calls)
+            if action in ('posts', 'antes', 'bets', 'calls'):
+                i = player_idx.get(player)
+                if i is None:
+                    return 0
+                amt = self._parsed(act)['amt']
+                contrib[i] += amt
+                return amt
+            if action == 'raises':
+                i = player_idx.get(player)
+                if i is None:
+                    return 0
+                prev = contrib[i]
+                delta = max(0, self._parsed(act)['raise_to'] - prev)
+                contrib[i] = prev + delta
+                return delta
+            # Money-returning action(s)
+            if action == 'uncalled':
+                # Return chips to the bettor: subtract from pot and reduce that player's street contrib
+                amt = self._parsed(act)['amt']
+                # Determine recipient (use explicit player if present; else parse from detail)
+                i = player_idx.get(player or self._parsed(act)['returned_to'])
+                if i is None:
+                    return 0
+                contrib[i] = max(0, contrib[i] - amt)
+                return -amt
+            # Any other verbs can be added here if they appear
+            return 0
 
-        for s in streets:
-            # Reset per-street contributions (for correct 'raises to' semantics)
-            street_contrib = {p['name']: 0 for p in hand['players']}
-            actions = hand['actions'][s]
-            if not actions:
-                if s == target_street:
-                    break
-                continue
+        for s in STREETS:
+            # Reset per-street contributions (for correct 'raises to' semantics), indexed by player
+            street_contrib = [0] * len(player_idx)
+            deltas = [pot_delta(act, street_contrib) for act in hand['actions'][s]]
+            pots = list(itertools.accumulate(deltas, initial=pot))
+            prefix[s] = pots
+            pot = pots[-1]
+
+        hand['_pot_prefix'] = prefix
+        return prefix
+
+    # ====== Incremental pot / board / contribution state ======
+
+    def _reset_stream_state(self):
+        """
+        Forget the running pot/contrib/board state (e.g., when a new hand is selected).
+        """
+        self._stream_state = {
+            'hand_idx': None,
+            'street': None,
+            'action_idx': -1,
+            'pot': 0,
+            'pot_contrib': {},
+            'contrib': {},
+            'ante_contrib': {},
+            'board': [],
+            'stacks': {},
+            'winnings': {},
+            'showdown': False,
+            'journal': [],
+        }
 
-            if s == target_street:
-                # Process up to current index inclusive
-                upto = max(0, min(target_action_index + 1, len(actions)))
-                for i in range(upto):
-                    process_action(actions[i], street_contrib)
-                break
-            else:
-                # Process entire street
-                for act in actions:
-                    process_action(act, street_contrib)
+    def _start_stream_state(self, hand, street: str, action_idx: int):
+        """
+        Rebuild the running state for (street, action_idx) from the start of the street.
+        Stacks, winnings and the showdown flag at each street start are computed once per
+        hand and cached in hand['_street_start'], so this only replays the street's own actions.
+        """
+        # Per-street contribution used for pot 'raises to' deltas (includes antes, as in compute_pot_upto)
+        pot_contrib = dict.fromkeys(hand['_player_names'], 0)
+        actions = hand['actions'].get(street, ())
+        upto = max(0, min(action_idx + 1, len(actions)))
+        starts = hand.get('_street_start')
+        if starts is None:
+            starts = hand['_street_start'] = {}
+        start = starts.get(street)
+        if start is None:
+            start = starts[street] = (
+                self.compute_stacks_upto(hand, street, -1),
+                self.compute_winnings_upto(hand, street, -1),
+                self.has_showdown_upto(hand, street, -1),
+            )
+        state = {
+            'hand_idx': self.current_hand_index,
+            'street': street,
+            'action_idx': -1,
+            'pot': self.compute_pot_upto(hand, street, -1),
+            'pot_contrib': pot_contrib,
+            'contrib': dict.fromkeys(hand['_player_names'], 0),
+            'ante_contrib': dict.fromkeys(hand['_player_names'], 0),
+            'board': self.compute_board_upto(hand, street, -1),
+            # Copies: the running state mutates these
+            'stacks': dict(start[0]),
+            'winnings': dict(start[1]),
+            'showdown': start[2],
+            # One undo record per applied action (see _apply_stream_action)
+            'journal': [],
+        }
+        self._stream_state = state
+        for act in actions[:upto]:
+            self._apply_stream_action(hand, act)
+        state['action_idx'] = action_idx
+        return state
 
-        return pot
+    def _apply_stream_action(self, hand, act):
+        """
+        Fold a single action into the running state. Mirrors compute_pot_upto,
+        compute_street_contrib_upto, compute_board_upto, compute_stacks_upto,
+        compute_winnings_upto and has_showdown_upto one step at a time.
+        Before applying, the scalars and the touched player's map entries are pushed onto
+        state['journal'] so _undo_stream_action can step back without a replay.
+        """
+        state = self._stream_state
+        action = act['action']
+        player = act['player']
+        touched = player
+        if action == 'uncalled' and not touched:
+            touched = self._parsed(act)['returned_to']
+        state['journal'].append((
+            state['pot'], state['showdown'], state['board'], touched,
+            tuple(state[k].get(touched, _MISSING) for k in _STREAM_PLAYER_MAPS),
+        ))
+        if action in ('shows', 'mucks'):
+            state['showdown'] = True
+            return
+        if action in _WIN_ACTIONS:
+            state['showdown'] = True
+            amt = self._parsed(act)['amt']
+            # Seated players only, as in compute_winnings_upto
+            if amt > 0 and player in state['pot_contrib']:
+                stacks = state['stacks']
+                stacks[player] = stacks.get(player, 0) + amt
+                winnings = state['winnings']
+                winnings[player] = winnings.get(player, 0) + amt
+            return
+        if action in ('checks', 'folds', 'is sitting out', 'has returned'):
+            return
+        pot_contrib = state['pot_contrib']
+        non_ante = state['contrib']
+        stacks = state['stacks']
+        # Stacks skip the board pseudo-player and non-positive amounts (as compute_stacks_upto does).
+        # Chip-moving verbs index the seat-prefilled maps, after skipping names that aren't
+        # seated (chat lines parsed as actions); winnings keep .get(), since the street-start
+        # winnings map omits zero entries.
+        if action in ('posts', 'antes', 'bets', 'calls', 'raises') and player not in pot_contrib:
+            return
+        to_stack = player and player != 'Board'
+        if action in ('posts', 'antes', 'bets', 'calls'):
+            amt = self._parsed(act)['amt']
+            state['pot'] += amt
+            pot_contrib[player] += amt
+            if action == 'antes':
+                state['ante_contrib'][player] += amt
+            else:
+                non_ante[player] += amt
+            if to_stack and amt > 0:
+                stacks[player] -= amt
+        elif action == 'raises':
+            target_total = self._parsed(act)['raise_to']
+            prev = pot_contrib[player]
+            delta = max(0, target_total - prev)
+            state['pot'] += delta
+            pot_contrib[player] = prev + delta
+            prev = non_ante[player]
+            delta = max(0, target_total - prev)
+            non_ante[player] = prev + delta
+            if to_stack and delta > 0:
+                stacks[player] -= delta
+        elif action == 'uncalled':
+            name = player or self._parsed(act)['returned_to']
+            if name not in pot_contrib:
+                return
+            amt = self._parsed(act)['amt']
+            state['pot'] -= amt
+            pot_contrib[name] = max(0, pot_contrib[name] - amt)
+            non_ante[name] = max(0, non_ante[name] - amt)
+            if amt > 0:
+                stacks[name] += amt
+        elif action == 'board':
+            street = state['street']
+            if street != 'preflop' and street in act.get('_detail_lower', ''):
+                state['board'] = self.compute_board_upto(hand, street, -1) + list(hand.get('board', {}).get(street, []) or [])
+
+    def _undo_stream_action(self):
+        """
+        Revert the most recently applied action using its journal record.
+        """
+        state = self._stream_state
+        pot, showdown, board, name, olds = state['journal'].pop()
+        state['pot'] = pot
+        state['showdown'] = showdown
+        state['board'] = board
+        for k, old in zip(_STREAM_PLAYER_MAPS, olds):
+            if old is _MISSING:
+                state[k].pop(name, None)
+            else:
+                state[k][name] = old
+
+    def _get_stream_state(self, hand, street: str, action_idx: int):
+        """
+        Return the running pot/contrib/board state up to and including action_idx on street.
+        Stepping forward on the same street applies only the new actions and stepping back
+        undoes them from the journal; a new hand or street rebuilds from the street start.
+        """
+        state = self._stream_state
+        if state['hand_idx'] != self.current_hand_index or state['street'] != street:
+            return self._start_stream_state(hand, street, action_idx)
+        if action_idx < state['action_idx']:
+            keep = max(0, min(action_idx + 1, len(hand['actions'].get(street, ()))))
+            journal = state['journal']
+            while len(journal) > keep:
+                self._undo_stream_action()
+            state['action_idx'] = action_idx
+        elif action_idx > state['action_idx']:
+            actions = hand['actions'].get(street, ())
+            for act in actions[max(0, state['action_idx'] + 1):action_idx + 1]:
+                self._apply_stream_action(hand, act)
+            state['action_idx'] = action_idx
+        return state
 
     def compute_stacks_upto(self, hand, target_street: str, target_action_index: int):
         """
@@ -1435,77 +2214,32 @@ class HandReplayerGUI:
         """
         # Initialize stacks from hand's seat info
         stacks = {p['name']: int(p.get('chips', 0)) for p in hand.get('players', [])}
-        streets = ['preflop', 'flop', 'turn', 'river']
 
-        def sub_from_stack(name: str, amt: int):
-            if not name or name == 'Board' or amt <= 0:
-                return
-            stacks[name] = stacks.get(name, 0) - amt
-
-        def add_to_stack(name: str, amt: int):
-            if not name or name == 'Board' or amt <= 0:
-                return
-            stacks[name] = stacks.get(name, 0) + amt
+        # Zeroed per-player template, copied at each street start
+        zero_contrib = dict.fromkeys(hand['_player_names'], 0)
 
-        for s in streets:
-            actions = hand.get('actions', {}).get(s, []) or []
+        for s in STREETS:
+            actions = hand['actions'][s]
             if not actions:
                 if s == target_street:
                     break
                 continue
 
             # Track per-street non-ante contribution for 'raises to' delta semantics
-            street_non_ante = {p['name']: 0 for p in hand.get('players', [])}
+            street_non_ante = zero_contrib.copy()
 
             if s == target_street:
                 upto = max(0, min((target_action_index or 0) + 1, len(actions)))
-                rng = range(upto)
+                seq = actions[:upto]
             else:
-                rng = range(len(actions))
+                seq = actions
 
-            for i in rng:
-                act = actions[i]
-                action = (act.get('action') or '').lower()
-                player = act.get('player')
-                detail = act.get('detail', '') or ''
+            for act in seq:
+                # Verbs missing from the map (checks, folds, shows, ...) don't move chips
+                handler = _STACK_HANDLERS.get(act['action'])
+                if handler is not None:
+                    handler(self, act, stacks, street_non_ante)
 
-                if action in ('checks', 'folds', 'shows', 'mucks', 'is sitting out', 'has returned'):
-                    continue
-
-                if action == 'posts':
-                    amt = self._extract_first_amount(detail)
-                    sub_from_stack(player, amt)
-                    street_non_ante[player] = street_non_ante.get(player, 0) + amt
-                elif action == 'antes':
-                    amt = self._extract_first_amount(detail)
-                    sub_from_stack(player, amt)  # antes do reduce stack
-                elif action == 'bets':
-                    amt = self._extract_first_amount(detail)
-                    sub_from_stack(player, amt)
-                    street_non_ante[player] = street_non_ante.get(player, 0) + amt
-                elif action == 'calls':
-                    amt = self._extract_first_amount(detail)
-                    sub_from_stack(player, amt)
-                    street_non_ante[player] = street_non_ante.get(player, 0) + amt
-                elif action == 'raises':
-                    target_total = self._extract_raise_to_amount(detail)
-                    prev = street_non_ante.get(player, 0)
-                    delta = max(0, target_total - prev)
-                    sub_from_stack(player, delta)
-                    street_non_ante[player] = prev + delta
-                elif action in ('wins', 'collected'):
-                    amt = self._extract_first_amount(detail)
-                    add_to_stack(player, amt)
-                elif action == 'uncalled':
-                    # Return the uncalled portion to the bettor and reduce their displayed contribution
-                    amt = self._extract_first_amount(detail)
-                    # Determine recipient (bettor)
-                    recipient = player or self._extract_returned_to_name(detail)
-                    if recipient:
-                        add_to_stack(recipient, amt)
-                        prev = street_non_ante.get(recipient, 0)
-                        street_non_ante[recipient] = max(0, prev - amt)
-                        
             if s == target_street:
                 break
 
@@ -1519,69 +2253,90 @@ class HandReplayerGUI:
         Returns a tuple: (non_ante_contrib, ante_contrib)
           - non_ante_contrib: blinds, bets, calls, raises
           - ante_contrib: antes only
+        Snapshots per action are cached on the hand (built on first use) as per-seat-order
+        lists; fresh name-keyed dicts are returned.
+        """
+        names = hand['_player_names']
+        prefix = hand.get('_contrib_prefix')
+        if prefix is None:
+            prefix = self._build_contrib_prefix(hand)
+        snaps = prefix.get(target_street)
+        if not snaps:
+            return dict.fromkeys(names, 0), dict.fromkeys(names, 0)
+        non_ante, antes, _ = snaps[max(0, min(target_action_index + 1, len(snaps) - 1))]
+        return dict(zip(names, non_ante)), dict(zip(names, antes))
+
+    def street_max_contrib_upto(self, hand, target_street: str, target_action_index: int):
+        """
+        Highest non-ante contribution on target_street up to and including
+        target_action_index (the amount a player must match to call).
+        """
+        prefix = hand.get('_contrib_prefix')
+        if prefix is None:
+            prefix = self._build_contrib_prefix(hand)
+        snaps = prefix.get(target_street)
+        if not snaps:
+            return 0
+        return snaps[max(0, min(target_action_index + 1, len(snaps) - 1))][2]
+
+    def _build_contrib_prefix(self, hand):
         """
-        non_ante = {p['name']: 0 for p in hand['players']}
-        antes = {p['name']: 0 for p in hand['players']}
-        actions = hand['actions'].get(target_street, [])
-        upto = max(0, min(target_action_index + 1, len(actions)))
-        for i in range(upto):
-            act = actions[i]
-            action = act['action']
-            detail = act.get('detail', '')
-            player = act['player']
-            if action in ('checks', 'folds', 'shows', 'mucks', 'collected', 'wins', 'is sitting out', 'has returned'):
-                continue
-            if action == 'posts':
-                amt = self._extract_first_amount(detail)
-                non_ante[player] = non_ante.get(player, 0) + amt
-            elif action == 'antes':
-                amt = self._extract_first_amount(detail)
-                antes[player] = antes.get(player, 0) + amt
-            elif action == 'bets':
-                amt = self._extract_first_amount(detail)
-                non_ante[player] = non_ante.get(player, 0) + amt
-            elif action == 'calls':
-                amt = self._extract_first_amount(detail)
-                non_ante[player] = non_ante.get(player, 0) + amt
-            elif action == 'raises':
-                target_total = self._extract_raise_to_amount(detail)
-                prev = non_ante.get(player, 0)
-                delta = max(0, target_total - prev)
-                non_ante[player] = prev + delta
-            elif action == 'uncalled':
-                # Reduce the bettor's displayed street contribution by the uncalled amount
-                amt = self._extract_first_amount(detail)
-                name = player or self._extract_returned_to_name(detail)
-                if name:
-                    non_ante[name] = max(0, non_ante.get(name, 0) - amt)
-        return non_ante, antes
+        Sweep each street once and store hand['_contrib_prefix'] =
+        {street: [(non_ante, antes, highest) after 0, 1, ... n actions]}, where non_ante and
+        antes are tuples of amounts indexed like hand['_player_names'] and highest is max(non_ante).
+        """
+        prefix = {}
+        player_idx = hand['_player_idx']
+        n = len(hand['_player_names'])
+        for street, actions in hand['actions'].items():
+            non_ante = [0] * n
+            antes = [0] * n
+            snaps = [(tuple(non_ante), tuple(antes), 0)]
+            for act in actions:
+                self._apply_contrib_action(act, player_idx, non_ante, antes)
+                snaps.append((tuple(non_ante), tuple(antes), max(non_ante, default=0)))
+            prefix[street] = snaps
+        hand['_contrib_prefix'] = prefix
+        return prefix
+
+    def _apply_contrib_action(self, act, player_idx, non_ante, antes):
+        """
+        Apply one action to the street's (non_ante, antes) contribution lists.
+        """
+        handler = _CONTRIB_HANDLERS.get(act['action'])
+        if handler is not None:
+            handler(self, act, player_idx, non_ante, antes)
 
     def has_showdown_upto(self, hand, target_street: str, target_action_index: int) -> bool:
         """
         Return True if any showdown-indicative action ('shows', 'mucks', 'wins', 'collected')
         has occurred up to and including target_action_index on target_street.
         Earlier streets are processed fully.
+        The position of the first such action is found once per hand and cached.
         """
-        showdown_actions = {'shows', 'mucks', 'wins', 'collected'}
-        streets = ['preflop', 'flop', 'turn', 'river']
-        for s in streets:
-            actions = hand.get('actions', {}).get(s, []) or []
-            if not actions:
-                if s == target_street:
-                    break
-                continue
-            if s == target_street:
-                upto = max(0, min((target_action_index or 0) + 1, len(actions)))
-                rng = range(upto)
-            else:
-                rng = range(len(actions))
-            for i in rng:
-                a = actions[i]
-                if (a.get('action') or '').lower() in showdown_actions:
-                    return True
-            if s == target_street:
-                break
-        return False
+        if '_showdown_at' not in hand:
+            hand['_showdown_at'] = self._find_first_showdown(hand)
+        first = hand['_showdown_at']
+        if first is None:
+            return False
+        street_idx, action_idx = first
+        target_idx = STREET_INDEX.get(target_street)
+        if target_idx is None:
+            # Unknown street: the whole hand is considered
+            return True
+        if street_idx != target_idx:
+            return street_idx < target_idx
+        return action_idx <= (target_action_index or 0)
+
+    def _find_first_showdown(self, hand):
+        """
+        Return (street index, action index) of the hand's first showdown action, or None.
+        """
+        for si, s in enumerate(STREETS):
+            for i, a in enumerate(hand['actions'][s]):
+                if a['action'] in _SHOWDOWN_ACTIONS:
+                    return si, i
+        return None
 
     def compute_winnings_upto(self, hand, target_street: str, target_action_index: int):
         """
@@ -1589,57 +2344,50 @@ class HandReplayerGUI:
         Includes both 'wins' and 'collected' actions, summing amounts across main and side pots.
         Returns: dict {player_name: total_won_int}
         """
-        winnings = {p['name']: 0 for p in hand.get('players', [])}
-        streets = ['preflop', 'flop', 'turn', 'river']
-        for s in streets:
-            actions = hand.get('actions', {}).get(s, []) or []
+        winnings = dict.fromkeys(hand['_player_names'], 0)
+        for s in STREETS:
+            actions = hand['actions'][s]
             if not actions:
                 if s == target_street:
                     break
                 continue
             if s == target_street:
                 upto = max(0, min((target_action_index or 0) + 1, len(actions)))
-                rng = range(upto)
+                seq = actions[:upto]
             else:
-                rng = range(len(actions))
-            for i in rng:
-                act = actions[i]
-                a = (act.get('action') or '').lower()
+                seq = actions
+            for act in seq:
+                a = act['action']
                 if a in ('wins', 'collected'):
                     player = act.get('player')
-                    if not player or player == 'Board':
+                    # Seated players only; also skips 'Board' and chat lines parsed as actions
+                    if player not in winnings:
                         continue
-                    amt = self._extract_first_amount(act.get('detail', '') or '')
-                    winnings[player] = winnings.get(player, 0) + max(0, amt)
+                    amt = self._parsed(act)['amt']
+                    winnings[player] += max(0, amt)
             if s == target_street:
                 break
         # Remove zero entries for cleaner rendering
         return {k: v for k, v in winnings.items() if v > 0}
 
-    def draw_winnings_markers(self, winnings_map, seat_positions, seat_map, cx, cy):
-        """
-        Draw winnings as chip markers near each player's seat.
-        Use a gold color and place slightly closer to the seat than bet markers to avoid overlap.
-        """
-        name_to_seat = {pdata['name']: seat for seat, pdata in seat_map.items()}
-        for name, amount in winnings_map.items():
-            seat = name_to_seat.get(name)
-            if not seat or amount <= 0:
-                continue
-            sx, sy = seat_positions[seat - 1]
-            wx, wy = self.get_centerward_position_fraction(sx, sy, cx, cy, fraction=0.22)
-            r = 26
-            # Gold-like fill with dark outline
-            self.table_canvas.create_oval(wx - r, wy - r, wx + r, wy + r, fill="#ffd700", outline="#7a5a00", width=2)
-            self.table_canvas.create_text(wx, wy, text=f"{amount:,}", fill="#000", font=("Arial", 9, "bold"))
-
     def compute_sitting_out_upto(self, hand, target_street: str, target_action_index: int):
         """
         Determine which players are currently sitting out up to and including target_action_index
         on target_street. Earlier streets are processed fully.
         Starts from any players marked 'sitting_out' in the seat info for this hand,
         then applies 'is sitting out' / 'has returned' actions.
-        """
+        Results are memoized per hand by (street, index); callers get a fresh set.
+        """
+        memo = hand.get('_sitting_out_memo')
+        if memo is None:
+            memo = hand['_sitting_out_memo'] = {}
+        key = (target_street, target_action_index)
+        cached = memo.get(key)
+        if cached is None:
+            cached = memo[key] = frozenset(self._scan_sitting_out(hand, target_street, target_action_index))
+        return set(cached)
+
+    def _scan_sitting_out(self, hand, target_street: str, target_action_index: int):
         sitting = set()
         try:
             for p in hand.get('players', []):
@@ -1648,21 +2396,19 @@ class HandReplayerGUI:
         except Exception:
             pass
 
-        streets = ['preflop', 'flop', 'turn', 'river']
-        for s in streets:
-            actions = hand.get('actions', {}).get(s, []) or []
+        for s in STREETS:
+            actions = hand['actions'][s]
             if not actions:
                 if s == target_street:
                     break
                 continue
             if s == target_street:
                 upto = max(0, min((target_action_index or 0) + 1, len(actions)))
-                rng = range(upto)
+                seq = actions[:upto]
             else:
-                rng = range(len(actions))
-            for i in rng:
-                a = actions[i]
-                act = (a.get('action') or '').lower()
+                seq = actions
+            for a in seq:
+                act = a['action']
                 name = a.get('player')
                 if not name or name == 'Board':
                     continue
@@ -1689,25 +2435,27 @@ class HandReplayerGUI:
         river = list(board.get('river', []) or [])
 
         visible = []
-        streets = ['preflop', 'flop', 'turn', 'river']
         s = target_street
+        reveal = hand.get('_board_reveal_idx')
+        if reveal is None:
+            reveal = self._build_board_reveal_idx(hand)
 
         if s == 'preflop':
             return visible
         elif s == 'flop':
             # Include flop only if its 'board' action is within range
-            actions = hand['actions'].get('flop', [])
-            upto = max(0, min(target_action_index + 1, len(actions)))
-            seen_flop_board = any(a.get('action') == 'board' and 'flop' in a.get('detail', '').lower() for a in actions[:upto])
+            upto = max(0, min(target_action_index + 1, len(hand['actions'].get('flop', []))))
+            reveal_idx = reveal['flop']
+            seen_flop_board = reveal_idx is not None and reveal_idx < upto
             if seen_flop_board:
                 visible.extend(flop)
             return visible
         elif s == 'turn':
             # Flop is already known fully at start of turn
             visible.extend(flop)
-            actions = hand['actions'].get('turn', [])
-            upto = max(0, min(target_action_index + 1, len(actions)))
-            seen_turn_board = any(a.get('action') == 'board' and 'turn' in a.get('detail', '').lower() for a in actions[:upto])
+            upto = max(0, min(target_action_index + 1, len(hand['actions'].get('turn', []))))
+            reveal_idx = reveal['turn']
+            seen_turn_board = reveal_idx is not None and reveal_idx < upto
             if seen_turn_board:
                 visible.extend(turn)
             return visible
@@ -1715,111 +2463,82 @@ class HandReplayerGUI:
             # Flop and turn are known at start of river
             visible.extend(flop)
             visible.extend(turn)
-            actions = hand['actions'].get('river', [])
-            upto = max(0, min(target_action_index + 1, len(actions)))
-            seen_river_board = any(a.get('action') == 'board' and 'river' in a.get('detail', '').lower() for a in actions[:upto])
+            upto = max(0, min(target_action_index + 1, len(hand['actions'].get('river', []))))
+            reveal_idx = reveal['river']
+            seen_river_board = reveal_idx is not None and reveal_idx < upto
             if seen_river_board:
                 visible.extend(river)
             return visible
         return visible
 
+    def _build_board_reveal_idx(self, hand):
+        """
+        Store hand['_board_reveal_idx'] = {street: index of its 'board' action or None}
+        so board visibility is a single comparison per redraw.
+        """
+        reveal = {}
+        for street in ('flop', 'turn', 'river'):
+            reveal[street] = next(
+                (i for i, a in enumerate(hand['actions'][street])
+                 if a.get('action') == 'board' and street in a.get('_detail_lower', '')),
+                None
+            )
+        hand['_board_reveal_idx'] = reveal
+        return reveal
+
     def compute_folded_players_upto(self, hand, target_street: str, target_action_index: int):
         """
-        Return a set of players who have folded up to and including target_action_index
+        Return a frozenset of players who have folded up to and including target_action_index
         on target_street. Earlier streets are processed fully.
         This is used to correctly restore fold state when stepping backward.
-        """
-        folded = set()
-        streets = ['preflop', 'flop', 'turn', 'river']
-        for s in streets:
-            actions = hand.get('actions', {}).get(s, []) or []
-            if not actions:
-                if s == target_street:
-                    break
-                continue
-
-            if s == target_street:
-                upto = max(0, min(target_action_index + 1, len(actions)))
-                rng = range(upto)
-            else:
-                rng = range(len(actions))
-
-            for i in rng:
-                act = actions[i]
+        Snapshots for every action are built once per hand and shared between lookups.
+        """
+        prefix = hand.get('_folded_at')
+        if prefix is None:
+            prefix = self._build_folded_prefix(hand)
+        if target_street not in prefix:
+            # Unknown street: everyone who folded during the hand
+            return prefix['river'][-1]
+        snaps = prefix[target_street]
+        return snaps[max(0, min(target_action_index + 1, len(snaps) - 1))]
+
+    def _build_folded_prefix(self, hand):
+        """
+        Store hand['_folded_at'] = {street: [folded frozenset after 0, 1, ... n actions]}.
+        Consecutive snapshots share the same frozenset until someone folds.
+        """
+        folded = frozenset()
+        prefix = {}
+        for s in STREETS:
+            snaps = [folded]
+            for act in hand['actions'][s]:
                 if act.get('player') and act.get('player') != 'Board' and act.get('action') == 'folds':
-                    folded.add(act['player'])
-            if s == target_street:
-                break
-        return folded
-
-    def compute_shown_cards_upto(self, hand, target_street: str, target_action_index: int):
-        """
-        Return a dict of {player: [card1, card2]} for players who have shown their hole cards
-        up to and including target_action_index on target_street. Earlier streets are processed fully.
-        Only the first 'shows' instance per player that contains bracketed hole cards is used.
-        """
-        shown = {}
-        streets = ['preflop', 'flop', 'turn', 'river']
-        for s in streets:
-            actions = hand.get('actions', {}).get(s, []) or []
-            if not actions:
-                if s == target_street:
-                    break
-                continue
-
-            if s == target_street:
-                upto = max(0, min(target_action_index + 1, len(actions)))
-                rng = range(upto)
-            else:
-                rng = range(len(actions))
-
-            for i in rng:
-                act = actions[i]
-                if act.get('action') != 'shows':
-                    continue
-                player = act.get('player')
-                if not player or player == 'Board':
-                    continue
-                # Keep only the first 'shows' with bracketed hole cards
-                if player not in shown:
-                    cards = self._extract_shown_cards(act.get('detail', '') or '')
-                    if cards:
-                        shown[player] = cards
-            if s == target_street:
-                break
-        return shown
-
-    def _extract_shown_cards(self, detail: str):
-        """
-        Extract two hole cards from a 'shows' detail string like: 'shows [9s Jd]'.
-        Returns a list like ['9s','jd'] or None if not present.
-        """
-        if not detail:
-            return None
-        m = re.search(r"\[([^\]]+)\]", detail)
-        if not m:
-            return None
-        inner = m.group(1).strip()
-        toks = [t.strip() for t in re.split(r"\s+", inner) if t.strip()]
-        # Filter to card-like tokens (rank+suit)
-        cards = []
-        for t in toks:
-            if re.match(r"^(?:[2-9]|10|[tTjJqQkKaA])[shdcSHDC]$", t) or re.match(r"^[2-9tTjJqQkKaA][shdcSHDC]$", t):
-                cards.append(t.lower())
-            if len(cards) >= 2:
-                break
-        return cards if len(cards) >= 2 else None
+                    folded = folded | {act['player']}
+                snaps.append(folded)
+            prefix[s] = snaps
+        hand['_folded_at'] = prefix
+        return prefix
 
     def compute_shown_cards_upto(self, hand, target_street: str, target_action_index: int):
         """
         Return a dict of {player: [card1, card2]} for players who have shown their hole cards
         up to and including target_action_index on target_street. Earlier streets are processed fully.
         Only the first 'shows' instance per player that contains bracketed hole cards is used.
-        """
+        Results are memoized per hand by (street, index); callers get a fresh dict.
+        """
+        memo = hand.get('_shown_memo')
+        if memo is None:
+            memo = hand['_shown_memo'] = {}
+        key = (target_street, target_action_index)
+        cached = memo.get(key)
+        if cached is None:
+            cached = memo[key] = self._scan_shown_cards(hand, target_street, target_action_index)
+        return dict(cached)
+
+    def _scan_shown_cards(self, hand, target_street: str, target_action_index: int):
         shown = {}
-        streets = ['preflop', 'flop', 'turn', 'river']
-        for s in streets:
-            actions = hand.get('actions', {}).get(s, []) or []
+        for s in STREETS:
+            actions = hand['actions'][s]
             if not actions:
                 if s == target_street:
                     break
@@ -1827,12 +2546,11 @@ class HandReplayerGUI:
 
             if s == target_street:
                 upto = max(0, min(target_action_index + 1, len(actions)))
-                rng = range(upto)
+                seq = actions[:upto]
             else:
-                rng = range(len(actions))
+                seq = actions
 
-            for i in rng:
-                act = actions[i]
+            for act in seq:
                 if act.get('action') != 'shows':
                     continue
                 player = act.get('player')
@@ -1840,7 +2558,7 @@ class HandReplayerGUI:
                     continue
                 # Keep only the first 'shows' with bracketed hole cards
                 if player not in shown:
-                    cards = self._extract_shown_cards(act.get('detail', '') or '')
+                    cards = self._extract_shown_cards(act['detail'])
                     if cards:
                         shown[player] = cards
             if s == target_street:
@@ -1854,15 +2572,14 @@ class HandReplayerGUI:
         """
         if not detail:
             return None
-        m = re.search(r"\[([^\]]+)\]", detail)
+        m = _BRACKET_RE.search(detail)
         if not m:
             return None
-        inner = m.group(1).strip()
-        toks = [t.strip() for t in re.split(r"\s+", inner) if t.strip()]
+        toks = m.group(1).split()
         # Filter to card-like tokens (rank+suit)
         cards = []
         for t in toks:
-            if re.match(r"^(?:[2-9]|10|[tTjJqQkKaA])[shdcSHDC]$", t) or re.match(r"^[2-9tTjJqQkKaA][shdcSHDC]$", t):
+            if t[-1] in _CARD_SUITS and t[:-1] in _CARD_RANKS:
                 cards.append(t.lower())
             if len(cards) >= 2:
                 break
@@ -1873,18 +2590,21 @@ class HandReplayerGUI:
         From the SUMMARY section seat lines, extract mucked hole cards.
         Returns dict {player_name: [card1, card2]} for any 'mucked [..]' entries.
         Example seat line: 'Seat 4: fade2night (big blind) mucked [3s 6d] - a pair of Threes'
+        Parsed once per hand and cached on the hand dict.
         """
-        out = {}
+        out = hand.get('_mucked_summary')
+        if out is not None:
+            return out
+        out = hand['_mucked_summary'] = {}
         summary = hand.get('summary', {}) or {}
         for _k, v in summary.items():
             if not v:
                 continue
-            m = re.search(r"^\s*([^:]+?)\s*(?:\([^)]*\))?\s*mucked\s*\[([^\]]+)\]", v, flags=re.IGNORECASE)
+            m = _MUCKED_RE.search(v)
             if not m:
                 continue
             name = m.group(1).strip()
-            inner = m.group(2).strip()
-            toks = [t.strip().lower() for t in re.split(r"\s+", inner) if t.strip()]
+            toks = m.group(2).lower().split()
             if len(toks) >= 2:
                 out[name] = toks[:2]
         return out
@@ -1910,74 +2630,84 @@ class HandReplayerGUI:
         top_margin = 10
         top = int((pot_cy - pot_radius) - h - top_margin)
 
+        # With Pillow, draw the whole board as a single composited image item
+        composite = self._get_board_composite(cards, w, h, gap)
+        if composite is not None:
+            self._create_canvas_image(left_anchor, top, composite)
+            return
+
         for i, code in enumerate(cards):
             left = left_anchor + i * (w + gap)
-            img = getattr(self, "get_card_image", None)
-            photo = img(code) if callable(img) else None
+            photo = self.get_card_image_sized(code, w, h)
             if photo is not None:
-                self.table_canvas.create_image(left, top, image=photo, anchor="nw")
-                if not hasattr(self, "_canvas_images"):
-                    self._canvas_images = []
-                self._canvas_images.append(photo)
+                self._create_canvas_image(left, top, photo)
             else:
                 self.table_canvas.create_rectangle(left, top, left + w, top + h, fill="#fff", outline="#000", width=2)
                 self.table_canvas.create_text(left + w // 2, top + h // 2, text=code, font=("Arial", 16, "bold"))
 
-    def draw_bet_markers(self, contrib_map, seat_positions, seat_map, cx, cy):
+    def _get_board_composite(self, cards, w, h, gap):
         """
-        Draw a small chip circle toward the center for each player's current street contribution.
-        Excludes antes.
+        Return one PhotoImage holding all visible community cards laid out left to right,
+        or None if Pillow is unavailable or any card image is missing.
+        Composites are cached by the tuple of cards so redraws on the same street reuse them.
         """
-        # Build name->seat index map for placement
-        name_to_seat = {}
-        for seat, pdata in seat_map.items():
-            name_to_seat[pdata['name']] = seat
-
-        for name, amount in contrib_map.items():
-            if amount <= 0:
-                continue
-            seat = name_to_seat.get(name)
-            if not seat:
-                continue
-            sx, sy = seat_positions[seat - 1]
-            # Position further toward the center than hole cards
-            bx, by = self.get_centerward_position_fraction(sx, sy, cx, cy, fraction=0.30)
-
-            # Draw chip circle and amount
-            r = 25
-            self.table_canvas.create_oval(bx - r, by - r, bx + r, by + r, fill="#70f040", outline="#222", width=2)
-            # Keep the text small to fit typical amounts
-            self.table_canvas.create_text(bx, by, text=f"{amount:,}", fill="#000", font=("Arial", 9, "bold"))
+        if not PIL_AVAILABLE:
+            return None
+        key = (tuple(c.lower() for c in cards), w, h, gap)
+        cache = self._board_composite_cache
+        photo = cache.get(key)
+        if photo is not None:
+            cache.move_to_end(key)
+            return photo
 
-    def draw_ante_markers(self, ante_map, seat_positions, seat_map, cx, cy):
-        """
-        Draw ante markers slightly closer to the center, in a brown color.
-        """
-        # Build name->seat index map for placement
-        name_to_seat = {}
-        for seat, pdata in seat_map.items():
-            name_to_seat[pdata['name']] = seat
+        try:
+            composite = Image.new("RGBA", (len(cards) * w + (len(cards) - 1) * gap, h), (0, 0, 0, 0))
+            for i, code in enumerate(key[0]):
+                src = self._card_source_images.get(code)
+                if src is None:
+                    return None
+                composite.paste(src.resize((w, h), Image.BILINEAR), (i * (w + gap), 0))
+            photo = ImageTk.PhotoImage(composite)
+        except Exception:
+            return None
 
-        for name, amount in ante_map.items():
-            if amount <= 0:
-                continue
-            seat = name_to_seat.get(name)
-            if not seat:
-                continue
-            sx, sy = seat_positions[seat - 1]
+        cache[key] = photo
+        if len(cache) > BOARD_COMPOSITE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return photo
 
-            # Slightly closer to the center than bet markers
-            ax, ay = self.get_centerward_position_fraction(sx, sy, cx, cy, fraction=0.38)
+    def draw_chip_markers(self, layer, entries):
+        """
+        Draw one chip marker layer ('bets', 'antes' or 'wins', see MARKER_STYLES) from its
+        ((name, seat, amount), ...) entries. Amount texts are tagged f"{layer}_{seat}" and
+        both items of a seat's marker f"{layer}_chip{seat}".
+        """
+        anchors_attr, r, fill, outline, text_fill = MARKER_STYLES[layer]
+        anchors = getattr(self, anchors_attr)
+        create_oval = self.table_canvas.create_oval
+        create_text = self.table_canvas.create_text
+        for _name, seat, amount in entries:
+            # Anchors are cached per canvas size
+            mx, my = anchors[seat - 1]
+            chip_tag = f"{layer}_chip{seat}"
+            create_oval(mx - r, my - r, mx + r, my + r, fill=fill, outline=outline, width=2, tags=chip_tag)
+            # Keep the text small to fit typical amounts
+            create_text(mx, my, text=f"{amount:,}", fill=text_fill, font=("Arial", 9, "bold"),
+                        tags=(f"{layer}_{seat}", chip_tag))
 
-            r = 22
-            # Brown fill with dark outline for contrast
-            self.table_canvas.create_oval(ax - r, ay - r, ax + r, ay + r, fill="#a0522d", outline="#3a2415", width=2)
-            self.table_canvas.create_text(ax, ay, text=f"{amount:,}", fill="#fff", font=("Arial", 9, "bold"))
     # ====== UI updates and navigation ======
 
-    def update_action_viewer(self):
+    def update_action_viewer(self, force=False):
+        """
+        Refresh the table, action log, info panel and buttons for the current position.
+        A repeat call for the position already on display (e.g. Home while at the start)
+        is skipped unless force is set, as select_hand does after resetting state.
+        """
         hand = self.hands[self.current_hand_index]
-        streets = ['preflop', 'flop', 'turn', 'river']
+        view_key = self._view_key
+        if (not force and view_key is not None and view_key[0] is hand
+                and view_key[1] == self.current_street and view_key[2] == self.current_action_index):
+            return
         actions = hand['actions'][self.current_street]
         # Street and action info moved/removed from bottom row (street now in Info panel)
 
@@ -2021,7 +2751,7 @@ class HandReplayerGUI:
         if actions and 0 <= self.current_action_index < len(actions):
             cur_act = actions[self.current_action_index]
             cur_name = cur_act.get('player')
-            cur_action = (cur_act.get('action') or '').lower()
+            cur_action = cur_act['action']
             if last_idx is not None and self.current_action_index > last_idx and cur_name and cur_name != 'Board':
                 if cur_action == 'is sitting out':
                     self.sitting_out_players.add(cur_name)
@@ -2038,36 +2768,7 @@ class HandReplayerGUI:
         hero_name = hand.get('hero')
         hole = hand.get('hole_cards')
         if hero_name and hole:
-            parts = [p.strip() for p in re.split(r'[\s,]+', hole) if p.strip()]
-            if len(parts) >= 2:
-                self.player_cards[hero_name] = [parts[0], parts[1]]
-        # Apply shown cards up to BEFORE the current action
-        prev_idx_for_show = max(-1, (self.current_action_index or 0) - 1)
-        try:
-            shown_map = self.compute_shown_cards_upto(hand, self.current_street, prev_idx_for_show)
-            for name, cards in shown_map.items():
-                self.player_cards[name] = cards
-        except Exception:
-            pass
-        # If the CURRENT action is a 'shows', apply it immediately so the reveal happens on this action
-        if actions and 0 <= self.current_action_index < len(actions):
-            cur_act = actions[self.current_action_index]
-            if cur_act.get('action') == 'shows' and cur_act.get('player') not in (None, 'Board'):
-                now_cards = self._extract_shown_cards(cur_act.get('detail', '') or '')
-                if now_cards:
-                    self.player_cards[cur_act['player']] = now_cards
-
-        # Rebuild visible hole cards based on hero info and any prior 'shows' before the current action.
-        # Start with all unknowns.
-        try:
-            self.player_cards = {p['name']: ['??', '??'] for p in hand['players']}
-        except Exception:
-            self.player_cards = {}
-        # Reveal hero hole cards if available
-        hero_name = hand.get('hero')
-        hole = hand.get('hole_cards')
-        if hero_name and hole:
-            parts = [p.strip() for p in re.split(r'[\s,]+', hole) if p.strip()]
+            parts = hole.replace(',', ' ').split()
             if len(parts) >= 2:
                 self.player_cards[hero_name] = [parts[0], parts[1]]
         # Apply shown cards up to BEFORE the current action
@@ -2092,8 +2793,7 @@ class HandReplayerGUI:
             mucked_from_summary = self._extract_mucked_cards_from_summary(hand)
             # Players who have already mucked before the current action
             mucks_before = set()
-            for i in range(max(0, prev_idx_for_show + 1)):
-                a = actions[i]
+            for a in actions[:max(0, prev_idx_for_show + 1)]:
                 if a.get('action') == 'mucks' and a.get('player'):
                     mucks_before.add(a['player'])
             for name in mucks_before:
@@ -2120,16 +2820,17 @@ class HandReplayerGUI:
                     and cur_act.get('action') == 'folds'
                     and cur_act.get('player') not in (None, 'Board')
             ):
-                self.folded_players.add(cur_act['player'])
+                self.folded_players = self.folded_players | {cur_act['player']}
         
-        self.prev_button.config(state='normal' if self.current_action_index > 0 else 'disabled')
-        self.next_button.config(state='normal' if self.has_next_action() else 'disabled')
-        # Refresh table to update pot and bet markers
-        self.update_table_canvas()
+        self._set_button_state('prev', 'normal' if self.current_action_index > 0 else 'disabled')
+        self._set_button_state('next', 'normal' if self.has_next_action() else 'disabled')
+        # Refresh table to update pot and bet markers (coalesced while keys auto-repeat)
+        self.request_table_redraw()
         self.display_action_history()
         # Update info panel (blinds/ante/pot/pot odds)
         self.update_info_panel()
         self._last_action_index = self.current_action_index
+        self._view_key = (hand, self.current_street, self.current_action_index)
 
         # Update CD-style button states based on current position
         try:
@@ -2140,14 +2841,20 @@ class HandReplayerGUI:
             # First button disabled only if we're at very first action overall
             first_s, first_i = self._get_first_action_pos(hand)
             at_first = (self.current_street == first_s and (self.current_action_index or 0) <= first_i)
-            self.first_button.config(state='disabled' if at_first else 'normal')
+            self._set_button_state('first', 'disabled' if at_first else 'normal')
             # Last button disabled only if we're at very last action overall
             last_s, last_i = self._get_last_action_pos(hand)
             at_last = (self.current_street == last_s and (self.current_action_index or 0) >= last_i)
-            self.last_button.config(state='disabled' if at_last else 'normal')
+            self._set_button_state('last', 'disabled' if at_last else 'normal')
         else:
-            self.first_button.config(state='disabled')
-            self.last_button.config(state='disabled')
+            self._set_button_state('first', 'disabled')
+            self._set_button_state('last', 'disabled')
+
+    def _set_button_state(self, name, state):
+        """Configure nav button `name` ('first'/'prev'/'next'/'last') only when its state changes."""
+        if self._btn_states.get(name) != state:
+            self._btn_states[name] = state
+            getattr(self, f"{name}_button").config(state=state)
 
     # ====== Jump helpers (beginning/end of hand) ======
     def _get_first_action_pos(self, hand):
@@ -2155,29 +2862,16 @@ class HandReplayerGUI:
         Return (street_name, action_index) for the first action in the hand.
         If no actions exist, default to ('preflop', 0).
         """
-        streets = ['preflop', 'flop', 'turn', 'river']
-        for s in streets:
-            actions = hand.get('actions', {}).get(s, []) or []
-            if actions:
-                return s, 0
-        return 'preflop', 0
+        positions, _ = self._get_flat_actions(hand)
+        return positions[0] if positions else ('preflop', 0)
 
     def _get_last_action_pos(self, hand):
         """
         Return (street_name, action_index) for the last action in the hand.
         If no actions exist, default to ('preflop', 0).
         """
-        streets = ['preflop', 'flop', 'turn', 'river']
-        last_s = None
-        last_i = 0
-        for s in streets:
-            actions = hand.get('actions', {}).get(s, []) or []
-            if actions:
-                last_s = s
-                last_i = len(actions) - 1
-        if last_s is None:
-            return 'preflop', 0
-        return last_s, last_i
+        positions, _ = self._get_flat_actions(hand)
+        return positions[-1] if positions else ('preflop', 0)
 
     def jump_to_hand_start(self):
         """Jump to the first action of the current hand."""
@@ -2203,48 +2897,64 @@ class HandReplayerGUI:
         if not self.hands or self.current_hand_index is None:
             return
         hand = self.hands[self.current_hand_index]
-        lines = []
-        streets = ['preflop', 'flop', 'turn', 'river']
-        for street in streets:
-            actions = hand['actions'][street]
-            if actions:
-                lines.append(f"{street.title()}:")
-                if street == self.current_street:
-                    idx = self.current_action_index
-                    for i, act in enumerate(actions):
-                        prefix = "-> " if i == idx else "   "
-                        lines.append(f"{prefix}{act['player']} {act['action']} {act['detail']}")
-                    break
-                else:
+        lines, base = self._get_action_log_lines(hand, self.current_street)
+        n_actions = len(hand['actions'].get(self.current_street, ()))
+        idx = self.current_action_index
+        arrow_line = None
+        if base is not None and idx is not None and 0 <= idx < n_actions:
+            arrow_line = base + idx + 1  # Text widget lines are 1-based
+
+        text = self.action_info_text
+        text.config(state='normal')
+        if self._log_lines_shown is lines:
+            # Same hand and street: only the '->' marker moves
+            old_line = self._log_arrow_line
+            if old_line != arrow_line:
+                if old_line is not None:
+                    text.delete(f"{old_line}.0", f"{old_line}.3")
+                    text.insert(f"{old_line}.0", "   ")
+                if arrow_line is not None:
+                    text.delete(f"{arrow_line}.0", f"{arrow_line}.3")
+                    text.insert(f"{arrow_line}.0", "-> ")
+        else:
+            shown = list(lines)
+            if arrow_line is not None:
+                shown[arrow_line - 1] = "-> " + shown[arrow_line - 1][3:]
+            text.delete(1.0, tk.END)
+            text.insert(tk.END, "\n".join(shown))
+            self._log_lines_shown = lines
+        self._log_arrow_line = arrow_line
+        text.config(state='disabled')
+
+    def _get_action_log_lines(self, hand, current_street):
+        """
+        Return (lines, base) for the action log shown while on current_street, cached per hand.
+        Lines cover every street up to and including current_street, each action prefixed with
+        three spaces; base is the 0-based line index of current_street's first action (or None).
+        """
+        cache = hand.setdefault('_log_lines', {})
+        entry = cache.get(current_street)
+        if entry is None:
+            lines = []
+            base = None
+            for street in STREETS:
+                actions = hand['actions'][street]
+                if actions:
+                    lines.append(f"{street.title()}:")
+                    if street == current_street:
+                        base = len(lines)
                     for act in actions:
                         lines.append(f"   {act['player']} {act['action']} {act['detail']}")
-        self.action_info_text.config(state='normal')
-        self.action_info_text.delete(1.0, tk.END)
-        self.action_info_text.insert(tk.END, "\n".join(lines))
-        self.action_info_text.config(state='disabled')
+                    if street == current_street:
+                        break
+            entry = cache[current_street] = (lines, base)
+        return entry
 
     def _action_to_overlay_text(self, action: str) -> str:
         """
         Map action keywords to seat overlay text. Return "" for actions we don't flash.
         """
-        if not action:
-            return ""
-        a = action.lower()
-        mapping = {
-            'bets': 'BET',
-            'calls': 'CALL',
-            'raises': 'RAISE',
-            'checks': 'CHECK',
-            'folds': 'FOLD',
-            'shows': 'SHOWS',
-            'mucks': 'MUCKS',
-            'is sitting out': 'SIT OUT',
-            'has returned': 'RETURNED',
-            'wins': 'WINS',
-            'collected': 'WINS',
-            # Intentionally exclude 'posts' and 'antes' to avoid flashing on forced bets
-        }
-        return mapping.get(a, "")
+        return _ACTION_OVERLAY.get(action.lower(), "") if action else ""
 
     def show_action_flash(self, player_name: str, overlay_text: str):
         """
@@ -2260,7 +2970,7 @@ class HandReplayerGUI:
 
         # Set flash state and repaint
         self.seat_action_flash = {'name': player_name, 'text': overlay_text}
-        self.update_table_canvas()
+        self.request_table_redraw()
 
         # Schedule clear
         self._seat_action_flash_after = self.root.after(ACTION_FLASH_MS, self.clear_action_flash)
@@ -2274,6 +2984,20 @@ class HandReplayerGUI:
             except Exception:
                 pass
             self._seat_action_flash_after = None
+        self.request_table_redraw()
+
+    def request_table_redraw(self):
+        """
+        Schedule a single table redraw for when Tk is idle. Any further requests made before
+        it runs (e.g., holding an arrow key) are folded into that one redraw of the latest state.
+        """
+        if self._redraw_pending:
+            return
+        self._redraw_pending = True
+        self.table_canvas.after_idle(self._do_redraw)
+
+    def _do_redraw(self):
+        self._redraw_pending = False
         self.update_table_canvas()
 
     # ====== Info panel helpers ======
@@ -2284,25 +3008,31 @@ class HandReplayerGUI:
         until the first non-forced-bet action appears.
         Returns an integer number of chips, or None if unavailable.
         """
-        try:
-            actions_pf = hand.get('actions', {}).get('preflop', []) or []
+        _end_idx, forced_sum = self._leading_forced_bets(hand)
+        if forced_sum <= 0:
+            return None
+        return int(round((forced_sum * 2) / 3.0))
+
+    def _leading_forced_bets(self, hand):
+        """
+        Return (index of the last leading 'posts'/'antes' preflop action or -1, their chip total).
+        Scanned once per hand and cached in hand['_leading_forced'].
+        """
+        cached = hand.get('_leading_forced')
+        if cached is None:
+            end_idx = -1
             forced_sum = 0
-            for a in actions_pf:
-                act = (a.get('action') or '').lower()
-                if act in ('posts', 'antes'):
-                    forced_sum += self._extract_first_amount(a.get('detail', '') or '')
-                else:
+            for i, a in enumerate(hand['actions']['preflop']):
+                if a['action'] not in ('posts', 'antes'):
                     break
-            if forced_sum <= 0:
-                return None
-            return int(round((forced_sum * 2) / 3.0))
-        except Exception:
-            return None
+                end_idx = i
+                forced_sum += self._parsed(a)['amt']
+            cached = hand['_leading_forced'] = (end_idx, forced_sum)
+        return cached
     def _fmt_amount(self, amt):
-        try:
+        if isinstance(amt, (int, float)):
             return f"${amt:,}"
-        except Exception:
-            return f"${amt}"
+        return f"${amt}"
 
     def _update_stack_mode_styles(self):
         """
@@ -2374,21 +3104,30 @@ class HandReplayerGUI:
     def _extract_blinds_antes(self, hand):
         """
         Derive small/big blinds and ante amounts from preflop actions.
-        Returns (sb, bb, ante) as ints or None if not seen.
+        Returns (sb, bb, ante) as ints or None if not seen. Cached per hand.
         """
+        cached = hand.get('_blinds_antes')
+        if cached is not None:
+            return cached
         sb = bb = ante = None
-        for act in hand.get('actions', {}).get('preflop', []):
+        for act in hand['actions']['preflop']:
             action = act.get('action')
-            detail = (act.get('detail') or "").lower()
             if action == 'posts':
+                detail = act.get('_detail_lower', '')
                 if sb is None and 'small blind' in detail:
-                    sb = self._extract_first_amount(detail)
+                    sb = self._parsed(act)['amt']
                 elif bb is None and 'big blind' in detail:
-                    bb = self._extract_first_amount(detail)
+                    bb = self._parsed(act)['amt']
             elif action == 'antes':
                 # Tournament antes are typically uniform; take first seen
                 if ante is None:
-                    ante = self._extract_first_amount(detail)
+                    ante = self._parsed(act)['amt']
+            else:
+                continue
+            # Only the first of each is used, so stop once all three are known
+            if sb is not None and bb is not None and ante is not None:
+                break
+        hand['_blinds_antes'] = (sb, bb, ante)
         return sb, bb, ante
 
     def _extract_bounty_from_header(self, header: str):
@@ -2402,11 +3141,7 @@ class HandReplayerGUI:
         if not header:
             return None
         # Look for: $<buyin> + $<bounty> (KO|Knockout)
-        m = re.search(
-            r"\$\s*\d+(?:\.\d{1,2})?\s*\+\s*\$(\d+(?:\.\d{1,2})?)\s*(?:KO|Knockout)\b",
-            header,
-            flags=re.IGNORECASE
-        )
+        m = _BOUNTY_RE.search(header)
         if m:
             bounty_val = m.group(1)
             # Normalize to two decimals if needed
@@ -2417,6 +3152,27 @@ class HandReplayerGUI:
         return None
     
     def update_info_panel(self):
+        """
+        Refresh the Info panel. Values are staged while the panel is computed and each
+        StringVar is written once at the end, only if its text actually changed.
+        """
+        self._staged_vars = staged = {}
+        try:
+            self._fill_info_panel()
+        finally:
+            self._staged_vars = None
+            for var, value in staged.values():
+                self._set_var(var, value)
+
+    def _set_var(self, var, value):
+        """Set a StringVar only when its value changes (or stage it during update_info_panel)."""
+        staged = self._staged_vars
+        if staged is not None:
+            staged[str(var)] = (var, value)
+        elif var.get() != value:
+            var.set(value)
+
+    def _fill_info_panel(self):
         """
         Populate Info panel:
           - Blinds: SB/BB
@@ -2426,15 +3182,15 @@ class HandReplayerGUI:
           - Pot odds: for the current actor (to call amount / (pot + to call))
         """
         # Defaults
-        self.info_handno_var.set(INFO_PLACEHOLDER)
-        self.info_blinds_var.set(INFO_PLACEHOLDER)
-        self.info_ante_var.set(INFO_PLACEHOLDER)
-        self.info_pot_var.set(INFO_PLACEHOLDER)
-        self.info_truebb_var.set(INFO_PLACEHOLDER)
-        self.info_pot_odds_var.set(INFO_PLACEHOLDER)
-        self.info_street_var.set(INFO_PLACEHOLDER)
-        self.info_pot_odds_player_var.set("")
-        self.info_pts_var.set(INFO_PLACEHOLDER)
+        self._set_var(self.info_handno_var, INFO_PLACEHOLDER)
+        self._set_var(self.info_blinds_var, INFO_PLACEHOLDER)
+        self._set_var(self.info_ante_var, INFO_PLACEHOLDER)
+        self._set_var(self.info_pot_var, INFO_PLACEHOLDER)
+        self._set_var(self.info_truebb_var, INFO_PLACEHOLDER)
+        self._set_var(self.info_pot_odds_var, INFO_PLACEHOLDER)
+        self._set_var(self.info_street_var, INFO_PLACEHOLDER)
+        self._set_var(self.info_pot_odds_player_var, "")
+        self._set_var(self.info_pts_var, INFO_PLACEHOLDER)
 
         if not self.hands or self.current_hand_index is None or self.current_street is None:
             # nothing to display
@@ -2442,12 +3198,12 @@ class HandReplayerGUI:
         hand = self.hands[self.current_hand_index]
         # Street name (Info panel, row with Hand #)
         try:
-            self.info_street_var.set(self.current_street.title() if self.current_street else INFO_PLACEHOLDER)
+            self._set_var(self.info_street_var, self.current_street.title() if self.current_street else INFO_PLACEHOLDER)
         except Exception:  # safety: current_street might be None
-            self.info_street_var.set(INFO_PLACEHOLDER)
+            self._set_var(self.info_street_var, INFO_PLACEHOLDER)
 
         # Hand number (current index + 1)
-        self.info_handno_var.set(str(self.current_hand_index + 1))
+        self._set_var(self.info_handno_var, str(self.current_hand_index + 1))
         # Blinds / Ante
         sb, bb, ante = self._extract_blinds_antes(hand)
         blinds_text = INFO_PLACEHOLDER
@@ -2458,24 +3214,24 @@ class HandReplayerGUI:
             # Append ante inline if present: "Blinds: $SB/$BB, Ante $X"
             if ante is not None:
                 blinds_text += f", Ante {self._fmt_amount(ante)}"
-        self.info_blinds_var.set(blinds_text)
+        self._set_var(self.info_blinds_var, blinds_text)
         # Ante is now displayed inline with Blinds; keep the separate var unused
         # to avoid showing a placeholder elsewhere.
-        self.info_ante_var.set("")
+        self._set_var(self.info_ante_var, "")
 
         # True BB (2/3 of all forced bets at start of hand).
         # Only applicable when antes are in play; otherwise show "N/A".
         if ante is None or ante <= 0:
-            self.info_truebb_var.set("N/A")
+            self._set_var(self.info_truebb_var, "N/A")
         else:
             try:
                 true_bb = self._compute_true_bb(hand)
                 if true_bb is None:
-                    self.info_truebb_var.set("N/A")
+                    self._set_var(self.info_truebb_var, "N/A")
                 else:
-                    self.info_truebb_var.set(self._fmt_amount(true_bb))
+                    self._set_var(self.info_truebb_var, self._fmt_amount(true_bb))
             except Exception:
-                self.info_truebb_var.set("N/A")
+                self._set_var(self.info_truebb_var, "N/A")
 
 
         # Pot before current action index
@@ -2487,13 +3243,7 @@ class HandReplayerGUI:
         # Bump prev_idx to the index of the last leading forced bet so the Info panel
         # shows the correct initial pot immediately.
         if self.current_street == 'preflop':
-            actions_pf = hand.get('actions', {}).get('preflop', [])
-            forced_end_idx = -1
-            for i, a in enumerate(actions_pf):
-                if a.get('action') in ('posts', 'antes'):
-                    forced_end_idx = i
-                else:
-                    break
+            forced_end_idx, _forced_sum = self._leading_forced_bets(hand)
             if prev_idx < forced_end_idx:
                 prev_idx = forced_end_idx
 
@@ -2501,200 +3251,15 @@ class HandReplayerGUI:
             pot_before = self.compute_pot_upto(hand, self.current_street, prev_idx)
         except Exception:
             pot_before = 0
-        self.info_pot_var.set(self._fmt_amount(pot_before))
-
-        # Helper(s) for SPR (Stack-to-Pot Ratio) — computed for the Hero only.
-        # Uses effective_stack / pot_amount where "effective stack" follows:
-        # - If exactly 2 active players: lesser of the two remaining stacks.
-        # - If >2 active players and Hero is the smallest: Hero's remaining stack.
-        # - Otherwise take the average of all active stacks; if Hero is the largest, exclude Hero from that average.
-        def _detect_hero_name(h):
-            try:
-                # Common patterns for hero detection
-                if isinstance(h.get('hero', None), str):
-                    return h.get('hero')
-                players = h.get('players', [])
-                for p in players or []:
-                    if isinstance(p, dict):
-                        if p.get('is_hero') or p.get('hero'):
-                            return p.get('name') or p.get('player')
-                # Fallback to instance attribute if present
-                return getattr(self, 'hero_name', None)
-            except Exception:
-                return getattr(self, 'hero_name', None)
-
-        def _starting_stacks(h):
-            stacks = {}
-            # Dict form: {"Alice": 1500, "Bob": 1800, ...}
-            if isinstance(h.get('stacks'), dict):
-                for n, amt in h.get('stacks', {}).items():
-                    try:
-                        stacks[n] = float(amt)
-                    except Exception:
-                        pass
-                if stacks:
-                    return stacks
-            # Players list form: [{"name": "...", "stack": ...}, ...]
-            players = h.get('players', [])
-            for p in players or []:
-                if isinstance(p, dict):
-                    name = p.get('name') or p.get('player')
-                    if not name:
-                        continue
-                    stack = p.get('stack', None)
-                    if stack is None:
-                        stack = p.get('chips', None)
-                    if stack is None:
-                        stack = p.get('starting_stack', None)
-                    try:
-                        if stack is not None:
-                            stacks[name] = float(stack)
-                    except Exception:
-                        pass
-            return stacks
-
-        def _street_order(actions_by_street):
-            # Normalize and order known streets; only include present keys, respecting typical order.
-            present = list(actions_by_street.keys() or [])
-            order_names = ['preflop', 'pre-flop', 'pre flop', 'flop', 'turn', 'river', 'showdown']
-            ordered = []
-            for want in order_names:
-                for k in present:
-                    if isinstance(k, str) and k.lower() == want:
-                        if k not in ordered:
-                            ordered.append(k)
-            # Append any remaining keys in original order, if not already included
-            for k in present:
-                if k not in ordered:
-                    ordered.append(k)
-            return ordered
-
-        def _total_contrib_and_folds_upto(h, street_key, upto_idx):
-            """
-            Aggregate total contributed chips per player across all streets up to
-            and including upto_idx on street_key. Also track folds.
-            """
-            by_street = h.get('actions', {}) or {}
-            contrib = {}
-            folded = set()
-            order = _street_order(by_street)
-            # Helper for adding/subtracting
-            def add_amt(d, k, v):
-                d[k] = d.get(k, 0.0) + float(v)
-            for sk in order:
-                acts = by_street.get(sk, []) or []
-                last_idx = len(acts) - 1
-                if sk == street_key:
-                    last_idx = upto_idx
-                if last_idx < 0:
-                    if sk == street_key:
-                        break
-                    else:
-                        continue
-                for i in range(0, min(last_idx, len(acts) - 1) + 1):
-                    a = acts[i] or {}
-                    p = a.get('player')
-                    if not p or p == 'Board':
-                        continue
-                    t = str(a.get('type', '')).lower()
-                    # detect amount-like fields
-                    amt = a.get('amount', None)
-                    if amt is None:
-                        # try common fields
-                        for k in ('bet', 'raise_to', 'posted', 'ante'):
-                            if a.get(k) is not None:
-                                amt = a.get(k)
-                                break
-                    # fold tracking
-                    if t == 'fold':
-                        folded.add(p)
-                    # uncalled/returned chips reduce contribution
-                    if 'uncalled' in t or 'return' in t:
-                        try:
-                            if amt is not None:
-                                add_amt(contrib, p, -abs(float(amt)))
-                        except Exception:
-                            pass
-                        continue
-                    # chip-committing actions
-                    if amt is not None and t not in ('win', 'collect'):
-                        try:
-                            add_amt(contrib, p, abs(float(amt)))
-                        except Exception:
-                            pass
-                if sk == street_key:
-                    break
-            return contrib, folded
-
-        def _remaining_stacks_upto(h, street_key, upto_idx):
-            base = _starting_stacks(h)
-            contrib, folded = _total_contrib_and_folds_upto(h, street_key, upto_idx)
-            remain = {}
-            for p, s in base.items():
-                left = s - float(contrib.get(p, 0.0))
-                remain[p] = left if left > 0 else 0.0
-            return remain, folded
-
-        def _effective_stack_for_hero(remain_map, folded_set, hero_name):
-            # Active players: not folded and with chips remaining
-            active = [p for p, s in remain_map.items() if s > 0 and p not in folded_set]
-            if hero_name is None or hero_name not in remain_map or hero_name not in active:
-                return None
-            hero_stack = remain_map.get(hero_name, 0.0)
-            others = [remain_map[p] for p in active if p != hero_name]
-            if len(active) < 2 or hero_stack <= 0:
-                return None
-            if len(active) == 2:
-                # heads-up: effective = lesser of two stacks
-                other_stack = others[0] if others else 0.0
-                return min(hero_stack, other_stack)
-            # 3+ players
-            min_other = min(others) if others else 0.0
-            max_other = max(others) if others else 0.0
-            if hero_stack <= min_other:
-                return hero_stack
-            if hero_stack >= max_other:
-                # exclude hero from average
-                return (sum(others) / len(others)) if others else None
-            # otherwise average of all active stacks (including hero)
-            return (hero_stack + sum(others)) / (len(others) + 0)  # len(active)
-
-        def _set_spr_for_state(h, street_key, upto_idx, pot_amount):
-            try:
-                hero = _detect_hero_name(h)
-                remain_map, folded_set = _remaining_stacks_upto(h, street_key, upto_idx)
-                eff = _effective_stack_for_hero(remain_map, folded_set, hero)
-                pot_amt = float(pot_amount)
-                # SPR (hero-only): effective stack / pot
-                if eff is None or eff <= 0 or pot_amt <= 0:
-                    self.info_spr_var.set(INFO_PLACEHOLDER)
-                else:
-                    spr = (eff / pot_amt)
-                    self.info_spr_var.set(f"{spr:.2f}")
-                # PTS (hero-only): percent the pot represents of HERO's remaining stack
-                hero_stack = None
-                if hero and (hero in remain_map) and (hero not in folded_set):
-                    try:
-                        hero_stack = float(remain_map.get(hero, 0.0))
-                    except Exception:
-                        hero_stack = None
-                if hero_stack is None or hero_stack <= 0:
-                    self.info_pts_var.set(INFO_PLACEHOLDER)
-                else:
-                    # If pot is 0, show 0.0%
-                    pts_pct = (pot_amt / hero_stack) * 100.0 if pot_amt >= 0 else 0.0
-                    self.info_pts_var.set(f"{pts_pct:.1f}%")
-            except Exception:
-                self.info_spr_var.set(INFO_PLACEHOLDER)
-                self.info_pts_var.set(INFO_PLACEHOLDER)
+        self._set_var(self.info_pot_var, self._fmt_amount(pot_before))
 
         # Pot odds for current actor (if applicable)
-        actions = hand.get('actions', {}).get(self.current_street, []) or []
+        actions = hand['actions'].get(self.current_street, ())
         if not actions:
-            self.info_pot_odds_var.set(INFO_PLACEHOLDER)
-            self.info_pot_odds_player_var.set("")
+            self._set_var(self.info_pot_odds_var, INFO_PLACEHOLDER)
+            self._set_var(self.info_pot_odds_player_var, "")
             # Update SPR for hero using current pot (no further actions on this street yet)
-            _set_spr_for_state(hand, self.current_street, -1, pot_before)
+            self._set_spr_for_state(hand, self.current_street, -1, pot_before)
             return
 
         # We want pot odds for the NEXT action, based on the state AFTER the current action.
@@ -2713,8 +3278,10 @@ class HandReplayerGUI:
         # Compute street contributions up to and including current index (state after current action)
         try:
             contrib_after, _ = self.compute_street_contrib_upto(hand, self.current_street, max(-1, cur_idx))
+            highest = self.street_max_contrib_upto(hand, self.current_street, max(-1, cur_idx))
         except Exception:
             contrib_after = {}
+            highest = 0
 
         # Find the next player action on this street
         next_actor = None
@@ -2728,19 +3295,13 @@ class HandReplayerGUI:
             next_idx += 1
 
         if not next_actor:
-            self.info_pot_odds_var.set(INFO_PLACEHOLDER)
-            self.info_pot_odds_player_var.set("")
+            self._set_var(self.info_pot_odds_var, INFO_PLACEHOLDER)
+            self._set_var(self.info_pot_odds_player_var, "")
             # Even if no next actor, still update SPR for hero at this state.
-            _set_spr_for_state(hand, self.current_street, max(-1, cur_idx), pot_for_next)
+            self._set_spr_for_state(hand, self.current_street, max(-1, cur_idx), pot_for_next)
             return
 
         # Facing call for next actor = max contribution - that player's contribution
-        highest = 0
-        if contrib_after:
-            try:
-                highest = max(contrib_after.values())
-            except Exception:
-                highest = 0
         actor_paid = contrib_after.get(next_actor, 0)
         to_call = max(0, highest - actor_paid)
 
@@ -2757,15 +3318,211 @@ class HandReplayerGUI:
             #   col3: player name (right)
             # Inline the actor name after the % to avoid shifting right-aligned columns
             # when names of different lengths appear.
-            self.info_pot_odds_var.set(f"{ratio_str} [{pct}] {next_actor}")
-            self.info_pot_odds_player_var.set("")
+            self._set_var(self.info_pot_odds_var, f"{ratio_str} [{pct}] {next_actor}")
+            self._set_var(self.info_pot_odds_player_var, "")
         else:
             # No call required -> N/A
-            self.info_pot_odds_var.set("N/A")
-            self.info_pot_odds_player_var.set("")
+            self._set_var(self.info_pot_odds_var, "N/A")
+            self._set_var(self.info_pot_odds_player_var, "")
 
         # Update SPR for hero using the pot for the next state on this street.
-        _set_spr_for_state(hand, self.current_street, max(-1, cur_idx), pot_for_next)
+        self._set_spr_for_state(hand, self.current_street, max(-1, cur_idx), pot_for_next)
+
+    # ====== SPR / PTS helpers (Info panel) ======
+    # Helper(s) for SPR (Stack-to-Pot Ratio) — computed for the Hero only.
+    # Uses effective_stack / pot_amount where "effective stack" follows:
+    # - If exactly 2 active players: lesser of the two remaining stacks.
+    # - If >2 active players and Hero is the smallest: Hero's remaining stack.
+    # - Otherwise take the average of all active stacks; if Hero is the largest, exclude Hero from that average.
+    def _detect_hero_name(self, h):
+        try:
+            # Common patterns for hero detection
+            if isinstance(h.get('hero', None), str):
+                return h.get('hero')
+            players = h.get('players', [])
+            for p in players or []:
+                if isinstance(p, dict):
+                    if p.get('is_hero') or p.get('hero'):
+                        return p.get('name') or p.get('player')
+            # Fallback to instance attribute if present
+            return getattr(self, 'hero_name', None)
+        except Exception:
+            return getattr(self, 'hero_name', None)
+
+    def _starting_stacks(self, h):
+        stacks = {}
+        # Dict form: {"Alice": 1500, "Bob": 1800, ...}
+        if isinstance(h.get('stacks'), dict):
+            for n, amt in h.get('stacks', {}).items():
+                try:
+                    stacks[n] = float(amt)
+                except Exception:
+                    pass
+            if stacks:
+                return stacks
+        # Players list form: [{"name": "...", "stack": ...}, ...]
+        players = h.get('players', [])
+        for p in players or []:
+            if isinstance(p, dict):
+                name = p.get('name') or p.get('player')
+                if not name:
+                    continue
+                stack = p.get('stack', None)
+                if stack is None:
+                    stack = p.get('chips', None)
+                if stack is None:
+                    stack = p.get('starting_stack', None)
+                try:
+                    if stack is not None:
+                        stacks[name] = float(stack)
+                except Exception:
+                    pass
+        return stacks
+
+    def _street_order(self, actions_by_street):
+        # Order present street keys by typical play order; unknown keys keep their original order at the end.
+        def rank(k):
+            return _STREET_PRIORITY.get(k.lower(), len(_STREET_PRIORITY)) if isinstance(k, str) else len(_STREET_PRIORITY)
+        return sorted(actions_by_street, key=rank)
+
+    def _total_contrib_and_folds_upto(self, h, street_key, upto_idx):
+        """
+        Aggregate total contributed chips per player across all streets up to
+        and including upto_idx on street_key. Also track folds.
+        """
+        contrib = defaultdict(float)
+        folded = set()
+        fold = folded.add
+        norm = self._normalized_contrib_actions(h)
+        for sk in self._street_keys_in_order(h):
+            seq = norm[sk]
+            if sk == street_key:
+                seq = seq[:upto_idx + 1] if upto_idx >= 0 else ()
+            for p, delta, is_fold in seq:
+                if is_fold:
+                    fold(p)
+                if delta is not None:
+                    contrib[p] += delta
+            if sk == street_key:
+                break
+        return contrib, folded
+
+    def _street_keys_in_order(self, h):
+        # Street keys never change after load, so the ordering is computed once per hand
+        order = h.get('_street_order')
+        if order is None:
+            order = h['_street_order'] = self._street_order(h.get('actions', {}) or {})
+        return order
+
+    def _normalized_contrib_actions(self, h):
+        """
+        Per street, (player, signed chip delta or None, is_fold) for each player action,
+        cached on the hand so the SPR walk only sums pre-converted floats.
+        """
+        norm = h.get('_norm_actions')
+        if norm is not None:
+            return norm
+        norm = {}
+        for sk, acts in (h.get('actions', {}) or {}).items():
+            out = norm[sk] = []
+            for a in acts or ():
+                a = a or {}
+                p = a.get('player')
+                if not p or p == 'Board':
+                    # No-op entry keeps positions aligned with the street's action indices
+                    out.append((p, None, False))
+                    continue
+                t = str(a.get('type', '')).lower()
+                # detect amount-like fields
+                amt = a.get('amount', None)
+                if amt is None:
+                    # try common fields
+                    for k in ('bet', 'raise_to', 'posted', 'ante'):
+                        if a.get(k) is not None:
+                            amt = a.get(k)
+                            break
+                delta = None
+                if amt is not None:
+                    try:
+                        # uncalled/returned chips reduce contribution; wins don't commit chips
+                        if 'uncalled' in t or 'return' in t:
+                            delta = -abs(float(amt))
+                        elif t not in ('win', 'collect'):
+                            delta = abs(float(amt))
+                    except Exception:
+                        pass
+                out.append((p, delta, t == 'fold'))
+        h['_norm_actions'] = norm
+        return norm
+
+    def _remaining_stacks_upto(self, h, street_key, upto_idx):
+        # Pure function of the hand and position: memoized per hand, results are read-only
+        memo = h.setdefault('_remaining_memo', {})
+        key = (street_key, upto_idx)
+        cached = memo.get(key)
+        if cached is not None:
+            return cached
+        base = self._starting_stacks(h)
+        contrib, folded = self._total_contrib_and_folds_upto(h, street_key, upto_idx)
+        remain = {}
+        for p, s in base.items():
+            left = s - float(contrib.get(p, 0.0))
+            remain[p] = left if left > 0 else 0.0
+        cached = memo[key] = (remain, frozenset(folded))
+        return cached
+
+    def _effective_stack_for_hero(self, remain_map, folded_set, hero_name):
+        # Active players: not folded and with chips remaining
+        active = [p for p, s in remain_map.items() if s > 0 and p not in folded_set]
+        if hero_name is None or hero_name not in remain_map or hero_name not in active:
+            return None
+        hero_stack = remain_map.get(hero_name, 0.0)
+        others = [remain_map[p] for p in active if p != hero_name]
+        if len(active) < 2 or hero_stack <= 0:
+            return None
+        if len(active) == 2:
+            # heads-up: effective = lesser of two stacks
+            other_stack = others[0] if others else 0.0
+            return min(hero_stack, other_stack)
+        # 3+ players
+        min_other = min(others) if others else 0.0
+        max_other = max(others) if others else 0.0
+        if hero_stack <= min_other:
+            return hero_stack
+        if hero_stack >= max_other:
+            # exclude hero from average
+            return (sum(others) / len(others)) if others else None
+        # otherwise average of all active stacks (including hero)
+        return (hero_stack + sum(others)) / (len(others) + 0)  # len(active)
+
+    def _set_spr_for_state(self, h, street_key, upto_idx, pot_amount):
+        try:
+            hero = self._detect_hero_name(h)
+            remain_map, folded_set = self._remaining_stacks_upto(h, street_key, upto_idx)
+            eff = self._effective_stack_for_hero(remain_map, folded_set, hero)
+            pot_amt = float(pot_amount)
+            # SPR (hero-only): effective stack / pot
+            if eff is None or eff <= 0 or pot_amt <= 0:
+                self._set_var(self.info_spr_var, INFO_PLACEHOLDER)
+            else:
+                spr = (eff / pot_amt)
+                self._set_var(self.info_spr_var, f"{spr:.2f}")
+            # PTS (hero-only): percent the pot represents of HERO's remaining stack
+            hero_stack = None
+            if hero and (hero in remain_map) and (hero not in folded_set):
+                try:
+                    hero_stack = float(remain_map.get(hero, 0.0))
+                except Exception:
+                    hero_stack = None
+            if hero_stack is None or hero_stack <= 0:
+                self._set_var(self.info_pts_var, INFO_PLACEHOLDER)
+            else:
+                # If pot is 0, show 0.0%
+                pts_pct = (pot_amt / hero_stack) * 100.0 if pot_amt >= 0 else 0.0
+                self._set_var(self.info_pts_var, f"{pts_pct:.1f}%")
+        except Exception:
+            self._set_var(self.info_spr_var, INFO_PLACEHOLDER)
+            self._set_var(self.info_pts_var, INFO_PLACEHOLDER)
 
     # ====== Notes / SQLite helpers ======
     def _init_db(self):
@@ -2779,6 +3536,14 @@ class HandReplayerGUI:
             os.makedirs(db_dir, exist_ok=True)
             self._db_path = os.path.join(db_dir, "notes.sqlite3")
             self._db = sqlite3.connect(self._db_path)
+            # WAL + NORMAL sync keeps each note save to a cheap append instead of a full fsync'd rewrite
+            # busy_timeout waits out a lock held by another replayer instance instead of failing the save
+            for pragma in ("journal_mode=WAL", "synchronous=NORMAL", "temp_store=MEMORY", "cache_size=-20000",
+                           "mmap_size=268435456", "busy_timeout=2000"):
+                try:
+                    self._db.execute(f"PRAGMA {pragma}")
+                except Exception:
+                    pass
             self._db.execute("""
                              CREATE TABLE IF NOT EXISTS notes (
                                                                   hand_id   TEXT PRIMARY KEY,
@@ -2801,17 +3566,14 @@ class HandReplayerGUI:
 
     def _get_hand_id_for_index(self, hand_index):
         try:
-            if hand_index is None or hand_index < 0 or hand_index >= len(self.hands):
+            if hand_index is None or hand_index < 0 or hand_index >= len(self._hand_ids):
                 return ""
-            hand = self.hands[hand_index]
-            header = (hand or {}).get('header') or ""
-            meta = self._extract_session_info(header)
-            return meta.get("hand_no") or ""
+            return self._hand_ids[hand_index]
         except Exception:
             return ""
 
     def _current_hand_id(self):
-        return self._get_hand_id_for_index(getattr(self, 'current_hand_index', None))
+        return self._get_hand_id_for_index(self.current_hand_index)
 
     def _load_notes_from_db(self, hand_id):
         """
@@ -2821,13 +3583,15 @@ class HandReplayerGUI:
             conn = self._db_conn()
             if not conn or not hand_id:
                 return "", ""
-            cur = conn.execute("SELECT note, mistakes FROM notes WHERE hand_id = ?", (hand_id,))
+            cur = conn.execute(_SQL_NOTES_BY_HAND, (hand_id,))
             row = cur.fetchone()
             if not row:
+                self._notes_cache[hand_id] = ("", "")
                 return "", ""
-            note_val = row[0] if row[0] is not None else ""
-            mistakes_val = row[1] if row[1] is not None else ""
-            return str(note_val), str(mistakes_val)
+            note_val = str(row[0] if row[0] is not None else "")
+            mistakes_val = str(row[1] if row[1] is not None else "")
+            self._notes_cache[hand_id] = (note_val.strip(), mistakes_val.strip())
+            return note_val, mistakes_val
         except Exception:
             return "", ""
 
@@ -2841,34 +3605,37 @@ class HandReplayerGUI:
                 return
             n = (note or "").strip()
             m = (mistakes or "").strip()
-            if n == "" and m == "":
-                conn.execute("DELETE FROM notes WHERE hand_id = ?", (hand_id,))
-                conn.commit()
+            if self._notes_cache.get(hand_id) == (n, m):
+                # Same text as the stored record: nothing to write
                 return
-            conn.execute(
-                """
-                INSERT INTO notes (hand_id, note, mistakes, updated_at)
-                VALUES (?, ?, ?, datetime('now'))
-                    ON CONFLICT(hand_id) DO UPDATE SET
-                    note = excluded.note,
-                                                mistakes = excluded.mistakes,
-                                                updated_at = excluded.updated_at
-                """,
-                (hand_id, n, m),
-            )
-            conn.commit()
+            # The connection context manager commits (or rolls back) the statement
+            with conn:
+                if n == "" and m == "":
+                    conn.execute(_SQL_DELETE_NOTE, (hand_id,))
+                else:
+                    conn.execute(_SQL_UPSERT_NOTE, (hand_id, n, m))
+            self._notes_cache[hand_id] = (n, m)
+            if self._note_ids is not None:
+                if n == "" and m == "":
+                    self._note_ids.discard(hand_id)
+                else:
+                    self._note_ids.add(hand_id)
         except Exception:
             pass
 
     def _hand_has_note_in_db(self, hand_id):
         """
         True if there is a non-empty note or mistakes saved for hand_id.
+        Answered from the notes cache when this hand's record has been read or written.
         """
+        cached = self._notes_cache.get(hand_id)
+        if cached is not None:
+            return cached != ("", "")
         try:
             conn = self._db_conn()
             if not conn or not hand_id:
                 return False
-            cur = conn.execute("SELECT note, mistakes FROM notes WHERE hand_id = ?", (hand_id,))
+            cur = conn.execute(_SQL_NOTES_BY_HAND, (hand_id,))
             row = cur.fetchone()
             if not row:
                 return False
@@ -2880,34 +3647,52 @@ class HandReplayerGUI:
 
     def _hands_with_notes_set(self, hand_ids):
         """
-        Given a list of hand_ids, return a set of those that have non-empty records.
+        Given a list of hand_ids, return a set of those that have non-empty records,
+        or None if the lookup failed.
         """
         out = set()
         try:
             conn = self._db_conn()
             if not conn:
                 return out
-            # Pull all note-bearing IDs from DB and intersect in Python
-            cur = conn.execute(
-                """
-                SELECT hand_id
-                FROM notes
-                WHERE COALESCE(TRIM(note),'') <> '' OR COALESCE(TRIM(mistakes),'') <> ''
-                """
-            )
-            db_ids = {row[0] for row in (cur.fetchall() or []) if row and row[0]}
-            if not hand_ids:
-                return db_ids
-            ids_set = {hid for hid in (hand_ids or []) if hid}
-            return db_ids.intersection(ids_set)
-        except Exception:
-            # Fall back to empty; markers will still appear as you visit hands via per-hand checks
+            ids = sorted({hid for hid in (hand_ids or []) if hid})
+            # One IN-list lookup per batch (kept under SQLite's bound-parameter limit)
+            for start in range(0, len(ids), 500):
+                batch = ids[start:start + 500]
+                cur = conn.execute(
+                    f"""
+                    SELECT hand_id
+                    FROM notes
+                    WHERE hand_id IN ({",".join("?" * len(batch))})
+                      AND (COALESCE(TRIM(note),'') <> '' OR COALESCE(TRIM(mistakes),'') <> '')
+                    """,
+                    batch,
+                )
+                out.update(row[0] for row in cur)
             return out
+        except Exception:
+            # Unknown: callers keep using per-hand checks, so markers still appear as you visit hands
+            return None
 
     def on_notes_changed(self, _event=None):
         if self._loading_notes:
             return
         self.notes_dirty = True
+        # Save once typing pauses, so navigating away rarely has a pending write left to do
+        if self._notes_save_after is not None:
+            try:
+                self.root.after_cancel(self._notes_save_after)
+            except Exception:
+                pass
+        self._notes_save_after = self.root.after(NOTES_SAVE_DEBOUNCE_MS, self._flush_notes)
+
+    def _flush_notes(self):
+        """Debounce timer callback: save the current hand's notes if still dirty."""
+        self._notes_save_after = None
+        idx = self.current_hand_index
+        if self.notes_dirty and idx is not None:
+            self.maybe_auto_save_notes_for_hand(idx)
+            self._update_hand_note_marker(idx)
 
     def load_notes_for_current_hand(self):
         """
@@ -2943,7 +3728,7 @@ class HandReplayerGUI:
         self._save_notes_to_db(hand_id, note_val, mistakes_val)
         self.notes_dirty = False
         # Update marker for current hand
-        idx = getattr(self, 'current_hand_index', None)
+        idx = self.current_hand_index
         if idx is not None:
             self._update_hand_note_marker(idx)
 
@@ -2960,13 +3745,16 @@ class HandReplayerGUI:
             try:
                 conn = self._db_conn()
                 if conn:
-                    conn.execute("DELETE FROM notes WHERE hand_id = ?", (hand_id,))
-                    conn.commit()
+                    with conn:
+                        conn.execute(_SQL_DELETE_NOTE, (hand_id,))
+                    self._notes_cache[hand_id] = ("", "")
+                    if self._note_ids is not None:
+                        self._note_ids.discard(hand_id)
             except Exception:
                 pass
         self.notes_dirty = False
         # Update marker for current hand
-        idx = getattr(self, 'current_hand_index', None)
+        idx = self.current_hand_index
         if idx is not None:
             self._update_hand_note_marker(idx)
 
@@ -2975,6 +3763,13 @@ class HandReplayerGUI:
         Auto-save notes if dirty when switching away from a hand.
         Uses the current content of the Note/Mistakes widgets and saves them under the hand_index provided.
         """
+        # A synchronous save supersedes any pending debounced one
+        if self._notes_save_after is not None:
+            try:
+                self.root.after_cancel(self._notes_save_after)
+            except Exception:
+                pass
+            self._notes_save_after = None
         if not self.notes_dirty:
             return
         hand_id = self._get_hand_id_for_index(hand_index)
@@ -2990,40 +3785,43 @@ class HandReplayerGUI:
         self._save_notes_to_db(hand_id, note_val, mistakes_val)
         self.notes_dirty = False
 
-    def _update_hand_note_marker(self, idx):
+    def _update_hand_note_marker(self, idx, has_note=None):
         """
         Add or remove the '#' marker for a given hand index depending on DB state.
+        has_note may be passed when the caller already looked it up; otherwise the
+        cached note-id set is used once loaded, falling back to a per-hand query.
         """
         if idx is None or idx < 0 or idx >= len(self.hands):
             return
+        if has_note is None:
+            hand_id = self._get_hand_id_for_index(idx)
+            if self._note_ids is not None:
+                has_note = hand_id in self._note_ids
+            else:
+                has_note = bool(hand_id and self._hand_has_note_in_db(hand_id))
+        # Markers sit at fixed per-index positions (the selector layout drops them all when
+        # rebuilt), so an existing marker that should stay is left untouched
+        old = self.hand_note_markers.get(idx)
+        if old and has_note:
+            return
         # Remove existing marker if present
-        old = self.hand_note_markers.pop(idx, None)
         if old:
+            del self.hand_note_markers[idx]
             try:
                 self.hand_selector_canvas.delete(old)
             except Exception:
                 pass
-        # Recreate if needed
-        hand_id = self._get_hand_id_for_index(idx)
-        if not (hand_id and self._hand_has_note_in_db(hand_id)):
+        if not has_note:
             return
         # Compute rectangle top-left for this index
         x = idx * (self._selector_box_w + self._selector_gap) + self._selector_gap
         y = self._selector_y_base
         try:
             mark_id = self.hand_selector_canvas.create_text(
-                x + 4, y + 4, text="#", fill="#111", font=("Arial", 12, "bold"), anchor="nw"
+                x + 4, y + 4, text="#", fill="#111", font=("Arial", 12, "bold"), anchor="nw",
+                tags=("hand_note_mark",)
             )
-            # Ensure the '#' marker doesn't block clicks on the underlying hand box.
-            # Bind the same click handler so clicking the marker selects the hand.
-            try:
-                self.hand_selector_canvas.tag_bind(
-                    mark_id,
-                    "<Button-1>",
-                    lambda e, sel_idx=idx: self.select_hand(sel_idx)
-                )
-            except Exception:
-                pass
+            # Clicks on the marker are resolved by on_hand_selector_click like the box beneath it
             self.hand_note_markers[idx] = mark_id
         except Exception:
             pass
@@ -3034,7 +3832,7 @@ class HandReplayerGUI:
         """
         try:
             # Auto-save current hand's notes if dirty
-            cur_idx = getattr(self, 'current_hand_index', None)
+            cur_idx = self.current_hand_index
             if cur_idx is not None:
                 self.maybe_auto_save_notes_for_hand(cur_idx)
         except Exception:
@@ -3056,35 +3854,31 @@ class HandReplayerGUI:
         Falls back to INFO_PLACEHOLDER-like empty strings if not found.
         """
         if not header:
-            header = ""
+            return dict(_EMPTY_SESSION_INFO)
         room = ""
         hand_no = ""
         table_no = ""
         date_str = ""
         game = ""
         # Room (prefix before "Game #")
-        m = re.match(r"^\s*(.+?)\s+Game\s*#", header, flags=re.IGNORECASE)
+        m = _ROOM_RE.match(header)
         if m:
             room = m.group(1).strip()
-        # Hand number after "Game #"
-        m = re.search(r"Game\s*#\s*([0-9]+)", header, flags=re.IGNORECASE)
-        if m:
-            hand_no = m.group(1).strip()
-        # Table number like "Table 4" (first occurrence)
-        m = re.search(r"\bTable\s+([A-Za-z0-9\-]+)", header, flags=re.IGNORECASE)
-        if m:
-            table_no = m.group(1).strip()
-        # Date in YYYY/MM/DD or YYYY-MM-DD
-        m_all = re.findall(r"\b(\d{4}[/-]\d{2}[/-]\d{2})\b", header)
-        if m_all:
-            date_str = m_all[-1]  # take the last date-like token
+        # Hand number and table number (first occurrence) and the last date-like token,
+        # from a single scan of the header
+        for m in _SESSION_HEADER_RE.finditer(header):
+            kind = m.lastgroup
+            if kind == 'date':
+                date_str = m.group('date')
+            elif kind == 'hand':
+                if not hand_no:
+                    hand_no = m.group('hand')
+            elif not table_no:
+                table_no = m.group('table')
         # Game: pick a segment (split by ' - ') that looks like a poker game name
-        candidates = [seg.strip() for seg in header.split(" - ") if seg.strip()]
-        game_keywords = ("hold", "omaha", "stud", "razz", "limit", "draw", "hilo", "hi/lo", "eight-or-better")
-        for seg in candidates:
-            s = seg.lower()
-            if any(k in s for k in game_keywords):
-                game = seg
+        for seg in header.split(" - "):
+            if _GAME_NAME_RE.search(seg):
+                game = seg.strip()
                 break
         # Bounty from header
         bounty = self._extract_bounty_from_header(header) or ""
@@ -3116,8 +3910,10 @@ class HandReplayerGUI:
             hand = self.hands[self.current_hand_index]
         except Exception:
             return
-        header = hand.get('header') or ""
-        meta = self._extract_session_info(header)
+        # Headers never change, so the parsed fields are cached on the hand
+        meta = hand.get('_session_info')
+        if meta is None:
+            meta = hand['_session_info'] = self._extract_session_info(hand.get('header') or "")
         # Set values (use placeholder if empty)
         self.session_room_var.set(meta.get("room") or INFO_PLACEHOLDER)
         self.session_game_var.set(meta.get("game") or INFO_PLACEHOLDER)
@@ -3126,61 +3922,52 @@ class HandReplayerGUI:
         self.session_table_var.set(meta.get("table_no") or INFO_PLACEHOLDER)
         self.info_bounty_var.set(meta.get("bounty") or INFO_PLACEHOLDER)
 
+    def _get_flat_actions(self, hand):
+        """
+        Return (positions, keys) for the hand's actions in playback order, built once and
+        cached on the hand:
+          - positions: [(street, action_index), ...] over non-empty streets
+          - keys: matching [(street_rank, action_index), ...] for bisecting arbitrary positions
+        """
+        flat = hand.get('_flat_actions')
+        if flat is None:
+            positions = []
+            keys = []
+            for rank, street in enumerate(STREETS):
+                for i in range(len(hand['actions'][street])):
+                    positions.append((street, i))
+                    keys.append((rank, i))
+            flat = hand['_flat_actions'] = (positions, keys)
+        return flat
+
+    def _current_flat_key(self):
+        rank = STREET_INDEX[self.current_street]
+        return rank, self.current_action_index
+
     def has_next_action(self):
         hand = self.hands[self.current_hand_index]
-        streets = ['preflop', 'flop', 'turn', 'river']
-        actions = hand['actions'][self.current_street]
-        if self.current_action_index < len(actions) - 1:
-            return True
-        idx = streets.index(self.current_street)
-        for next_idx in range(idx + 1, len(streets)):
-            next_street = streets[next_idx]
-            if hand['actions'][next_street]:
-                return True
-        return False
+        positions, keys = self._get_flat_actions(hand)
+        return bisect.bisect_right(keys, self._current_flat_key()) < len(keys)
 
     def next_action(self):
         hand = self.hands[self.current_hand_index]
-        streets = ['preflop', 'flop', 'turn', 'river']
-        actions = hand['actions'][self.current_street]
-        if self.current_action_index < len(actions) - 1:
-            self.current_action_index += 1
+        positions, keys = self._get_flat_actions(hand)
+        pos = bisect.bisect_right(keys, self._current_flat_key())
+        if pos < len(positions):
+            self.current_street, self.current_action_index = positions[pos]
             self.update_action_viewer()
         else:
-            idx = streets.index(self.current_street)
-            next_street_found = False
-            for next_idx in range(idx + 1, len(streets)):
-                next_street = streets[next_idx]
-                if hand['actions'][next_street]:
-                    self.current_street = next_street
-                    self.current_action_index = 0
-                    self.update_action_viewer()
-                    next_street_found = True
-                    break
-            if not next_street_found:
-                self.next_button.config(state='disabled')
+            self._set_button_state('next', 'disabled')
 
     def prev_action(self):
         hand = self.hands[self.current_hand_index]
-        streets = ['preflop', 'flop', 'turn', 'river']
-        actions = hand['actions'][self.current_street]
-        if self.current_action_index > 0:
-            self.current_action_index -= 1
+        positions, keys = self._get_flat_actions(hand)
+        pos = bisect.bisect_left(keys, self._current_flat_key()) - 1
+        if pos >= 0:
+            self.current_street, self.current_action_index = positions[pos]
             self.update_action_viewer()
         else:
-            idx = streets.index(self.current_street)
-            prev_street_found = False
-            for prev_idx in range(idx - 1, -1, -1):
-                prev_street = streets[prev_idx]
-                prev_actions = hand['actions'][prev_street]
-                if prev_actions:
-                    self.current_street = prev_street
-                    self.current_action_index = len(prev_actions) - 1
-                    self.update_action_viewer()
-                    prev_street_found = True
-                    break
-            if not prev_street_found:
-                self.prev_button.config(state='disabled')
+            self._set_button_state('prev', 'disabled')
 
     def refresh_all_note_markers(self):
         """
@@ -3189,8 +3976,15 @@ class HandReplayerGUI:
         """
         try:
             count = len(self.hands) if self.hands else 0
-            for i in range(count):
-                self._update_hand_note_marker(i)
+            hand_ids = [self._get_hand_id_for_index(i) for i in range(count)]
+            # One batched DB lookup instead of a query per hand
+            with_notes = self._hands_with_notes_set(hand_ids)
+            if with_notes is None:
+                # Lookup failed: leave _note_ids unset so markers fall back to per-hand queries
+                return
+            self._note_ids = with_notes
+            for i, hand_id in enumerate(hand_ids):
+                self._update_hand_note_marker(i, bool(hand_id) and hand_id in with_notes)
         except Exception:
             pass
 
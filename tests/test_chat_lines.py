@@ -0,0 +1,143 @@
+"""
+Chat lines in a hand history ("railbird: he calls 5000 ...") match the parser's action
+pattern and come through as actions by players who aren't seated. They must not move chips:
+pot, stacks and street contributions should equal those of the same hand without the chat.
+"""
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ft_hand_parser import FullTiltHandParser
+from replayer import HandReplayerGUI
+
+
+CHAT_LINES = {
+    'railbird: this guy calls 5000 with anything',
+    'railbird: wow he raises to 900 lol',
+    'Uncalled bet of 100 returned to railbird',
+    'spectator: he bets 200 here',
+    'railbird: posts 20',
+    'railbird: nice, he wins 300 easy',
+}
+
+HAND = """\
+Full Tilt Poker Game #27412345678: $3 + $0.30 KO Sit & Go (214713178), Table 4 - 15/30 - No Limit Hold'em - 20:15:32 ET - 2011/01/26
+Seat 1: alice (1,500)
+Seat 2: bob (1,470)
+Seat 3: carol (1,530)
+Seat 5: Hero (1,500)
+Seat 7: dave (1,500), is sitting out
+Seat 9: erin (2,000)
+alice antes 5
+bob antes 5
+carol antes 5
+Hero antes 5
+dave antes 5
+erin antes 5
+bob posts the small blind of 15
+carol posts the big blind of 30
+The button is in seat #1
+*** HOLE CARDS ***
+Dealt to Hero [Ah Kd]
+Hero raises to 90
+railbird: this guy calls 5000 with anything
+dave folds
+railbird: wow he raises to 900 lol
+erin calls 90
+alice folds
+bob folds
+carol raises to 300
+Hero calls 210
+erin folds
+Uncalled bet of 100 returned to railbird
+*** FLOP *** [2c 7d Jh]
+carol bets 400
+spectator: he bets 200 here
+Hero raises to 1,195, and is all in
+carol calls 795
+*** TURN *** [2c 7d Jh] [Qs]
+*** RIVER *** [2c 7d Jh Qs] [3h]
+carol shows [Jd Js]
+railbird: posts 20
+Hero mucks
+railbird: nice, he wins 300 easy
+carol wins the pot (2,885)
+*** SUMMARY ***
+Total pot 2,885 | Rake 0
+Board: [2c 7d Jh Qs 3h]
+Seat 1: alice (button) folded before the Flop
+Seat 3: carol (big blind) showed [Jd Js] and won (2,885) with three of a kind, Jacks
+Seat 5: Hero mucked [Ah Kd] - a pair of Aces
+"""
+
+# Actions that survive in the chat-free hand: seated players plus the parser's 'Board' entries
+KEPT_PLAYERS = ('alice', 'bob', 'carol', 'Hero', 'dave', 'erin', 'Board')
+
+
+def parse_hand(text):
+    fd, path = tempfile.mkstemp(suffix='.txt')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        parser = FullTiltHandParser(path)
+        parser.parse()
+        return parser.hands[0]
+    finally:
+        os.remove(path)
+
+
+class ChatLineTests(unittest.TestCase):
+    def setUp(self):
+        # The pot/stack helpers only need the parsed hand, not a window
+        self.app = HandReplayerGUI.__new__(HandReplayerGUI)
+        self.hand = parse_hand(HAND)
+        clean = ''.join(line for line in HAND.splitlines(True) if line.rstrip('\n') not in CHAT_LINES)
+        self.clean = parse_hand(clean)
+
+    def test_chat_lines_parse_as_unseated_actions(self):
+        players = {act['player'] for street in self.hand['actions'].values() for act in street}
+        self.assertIn('railbird: this guy', players)
+        self.assertIn('railbird', players)
+
+    def test_process_action_skips_unseated_players(self):
+        self.app.pot = 0
+        contrib = dict.fromkeys(self.hand['_player_names'], 0)
+        for act in self.hand['actions']['preflop']:
+            self.app.process_action(act, contrib)
+        self.assertEqual(self.app.pot, 735)
+        self.assertEqual(contrib, {'alice': 0, 'bob': 15, 'carol': 300, 'Hero': 300, 'dave': 0, 'erin': 90})
+
+    def test_pot_and_stacks(self):
+        expected = {
+            'preflop': (725, {'alice': 1495, 'bob': 1450, 'carol': 1225, 'Hero': 1195, 'dave': 1495, 'erin': 1905}),
+            'flop': (3115, {'alice': 1495, 'bob': 1450, 'carol': 30, 'Hero': 0, 'dave': 1495, 'erin': 1905}),
+            'river': (3115, {'alice': 1495, 'bob': 1450, 'carol': 2915, 'Hero': 0, 'dave': 1495, 'erin': 1905}),
+        }
+        for street, (pot, stacks) in expected.items():
+            n = len(self.hand['actions'][street])
+            self.assertEqual(self.app.compute_pot_upto(self.hand, street, n), pot, street)
+            self.assertEqual(self.app.compute_stacks_upto(self.hand, street, n), stacks, street)
+
+    def test_matches_hand_without_chat(self):
+        # Compare at every action: the chat hand repeats the clean hand's last value after each chat line
+        for street in ('preflop', 'flop', 'turn', 'river'):
+            acts = self.hand['actions'][street]
+            clean_acts = self.clean['actions'][street]
+            j = -1
+            for i, act in enumerate(acts):
+                if act['player'] in KEPT_PLAYERS:
+                    j += 1
+                self.assertEqual(self.app.compute_pot_upto(self.hand, street, i),
+                                 self.app.compute_pot_upto(self.clean, street, j), (street, i))
+                self.assertEqual(self.app.compute_stacks_upto(self.hand, street, i),
+                                 self.app.compute_stacks_upto(self.clean, street, j), (street, i))
+                self.assertEqual(self.app.compute_street_contrib_upto(self.hand, street, i),
+                                 self.app.compute_street_contrib_upto(self.clean, street, j), (street, i))
+            self.assertEqual(j, len(clean_acts) - 1, street)
+
+
+if __name__ == '__main__':
+    unittest.main()